@@ -48,12 +48,23 @@ Rectangle {
             id: logo
             //match SDDM/lockscreen avatar positioning
             readonly property real size: Kirigami.Units.gridUnit * 8
+            // Widths of the pre-scaled images/Logo-<width>.png, filled in by mies.splash
+            readonly property var widths: [/*REPLACE--LOGO-WIDTHS*/]
 
             anchors.centerIn: parent
-            source: "images/Logo.png"
+            // Smallest pre-scaled logo covering the on-screen size, so nothing large is decoded
+            source: {
+                var needed = size * Screen.devicePixelRatio;
+                for (var i = 0; i < widths.length; i++) {
+                    if (widths[i] >= needed) {
+                        return "images/Logo-" + widths[i] + ".png";
+                    }
+                }
+                return "images/Logo.png";
+            }
 
             sourceSize.width: size
-            sourceSize.height: sizes
+            sourceSize.height: size
             smooth: true
             visible: true
         }
@@ -0,0 +1,4 @@
+"""
+Catppuccin Mies theme tooling.
+Qt-free helpers shared by the preview tool, the installer and the build scripts.
+"""
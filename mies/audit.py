@@ -0,0 +1,207 @@
+"""
+WCAG contrast and color-distance audit of the color schemes.
+Every foreground/background pair of each [Colors:*] group in Base.colors is
+resolved for all flavors x accents into NumPy arrays, and relative luminance,
+contrast ratios and CIEDE2000 distances are computed for the whole matrix at
+once. The report is written as JSON.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy is required for the audit "
+                      "(Arch Linux: sudo pacman -S python-numpy, other distros: pip install numpy)") from None
+
+from mies.kconfig import load_kconfig
+from mies.palette import ACCENTS, BASE_COLORS_FILE
+from mies.palette_index import open_index
+from mies.paths import FLAVORS
+
+# Minimum contrast ratios: body text must meet WCAG AA, everything else the
+# AA large-text / UI component threshold.
+TARGETS = {"ForegroundNormal": 4.5}
+DEFAULT_TARGET = 3.0
+
+BACKGROUNDS = ("BackgroundNormal", "BackgroundAlternate")
+RGB_RE = re.compile(r'^\d+\s*,\s*\d+\s*,\s*\d+$')
+
+# sRGB (D65) linear RGB -> XYZ
+RGB_TO_XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                       [0.2126729, 0.7151522, 0.0721750],
+                       [0.0193339, 0.1191920, 0.9503041]])
+WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+def color_pairs(source: Path = BASE_COLORS_FILE) -> list:
+    """(group, foreground key, background key, fg ref, bg ref) for every pair."""
+    groups = {group[0]: keys for group, keys in load_kconfig(source).groups.items()
+              if len(group) == 1 and group[0].startswith("Colors:")}
+
+    pairs = []
+    for group, values in groups.items():
+        for bg in BACKGROUNDS:
+            if bg not in values:
+                continue
+            for fg, ref in values.items():
+                if fg.startswith("Foreground"):
+                    pairs.append((group, fg, bg, ref, values[bg]))
+    return pairs
+
+
+def _linear(srgb):
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def resolve(pairs: list, flavors: list, accents: list) -> tuple:
+    """Linear RGB arrays of shape (variants, pairs, 3) for foregrounds and backgrounds."""
+    index = open_index()
+    refs = sorted({ref for pair in pairs for ref in pair[3:]})
+    slot = {ref: i for i, ref in enumerate(refs)}
+
+    table = np.empty((len(flavors) * len(accents), len(refs), 3))
+    for v, (flavor, accent) in enumerate((f, a) for f in flavors for a in accents):
+        for ref, i in slot.items():
+            if ref == "--accentColor":
+                table[v, i] = index.linear(flavor, accent.lower())
+            elif ref.startswith("$"):
+                table[v, i] = index.linear(flavor, ref[1:])
+            elif RGB_RE.match(ref):
+                table[v, i] = _linear(np.array([int(c) for c in ref.split(",")]) / 255)
+            else:
+                raise ValueError(f"Cannot resolve color {ref!r}")
+
+    fg = table[:, [slot[pair[3]] for pair in pairs]]
+    bg = table[:, [slot[pair[4]] for pair in pairs]]
+    return fg, bg
+
+
+def luminance(linear_rgb):
+    """WCAG relative luminance of linear RGB, over the last axis."""
+    return linear_rgb @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast(fg, bg):
+    """WCAG contrast ratio of two linear RGB arrays."""
+    l1, l2 = luminance(fg), luminance(bg)
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def to_lab(linear_rgb):
+    xyz = (linear_rgb @ RGB_TO_XYZ.T) / WHITE_D65
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], -1)
+
+
+def ciede2000(lab1, lab2):
+    """CIEDE2000 color difference between two Lab arrays, over the last axis."""
+    L1, a1, b1 = np.moveaxis(lab1, -1, 0)
+    L2, a2, b2 = np.moveaxis(lab2, -1, 0)
+
+    c_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(c_bar ** 7 / (c_bar ** 7 + 25 ** 7)))
+    a1p, a2p = (1 + g) * a1, (1 + g) * a2
+    c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    dLp = L2 - L1
+    dCp = c2p - c1p
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(c1p * c2p == 0, 0, dhp)
+    dHp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp / 2))
+
+    L_bar = (L1 + L2) / 2
+    c_bar_p = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_bar = np.where(np.abs(h1p - h2p) > 180,
+                     np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2), h_sum / 2)
+    h_bar = np.where(c1p * c2p == 0, h_sum, h_bar)
+
+    t = (1 - 0.17 * np.cos(np.radians(h_bar - 30)) + 0.24 * np.cos(np.radians(2 * h_bar))
+         + 0.32 * np.cos(np.radians(3 * h_bar + 6)) - 0.20 * np.cos(np.radians(4 * h_bar - 63)))
+    d_theta = 30 * np.exp(-(((h_bar - 275) / 25) ** 2))
+    r_c = 2 * np.sqrt(c_bar_p ** 7 / (c_bar_p ** 7 + 25 ** 7))
+    s_l = 1 + 0.015 * (L_bar - 50) ** 2 / np.sqrt(20 + (L_bar - 50) ** 2)
+    s_c = 1 + 0.045 * c_bar_p
+    s_h = 1 + 0.015 * c_bar_p * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+
+    return np.sqrt((dLp / s_l) ** 2 + (dCp / s_c) ** 2 + (dHp / s_h) ** 2
+                   + r_t * (dCp / s_c) * (dHp / s_h))
+
+
+def audit(flavors: Iterable[str] = FLAVORS, accents: Iterable[str] = ACCENTS,
+          source: Path = BASE_COLORS_FILE) -> dict:
+    """Audit every pair for every flavor x accent and return the report."""
+    flavors, accents = list(flavors), list(accents)
+    pairs = color_pairs(source)
+    fg, bg = resolve(pairs, flavors, accents)
+
+    ratios = contrast(fg, bg)
+    distances = ciede2000(to_lab(fg), to_lab(bg))
+    targets = np.array([TARGETS.get(pair[1], DEFAULT_TARGET) for pair in pairs])
+    passed = ratios >= targets
+
+    results = []
+    variants = [(f, a) for f in flavors for a in accents]
+    for v, (flavor, accent) in enumerate(variants):
+        for p, (group, fg_key, bg_key, _, _) in enumerate(pairs):
+            results.append({
+                "flavor": flavor,
+                "accent": accent,
+                "group": group,
+                "foreground": fg_key,
+                "background": bg_key,
+                "contrast": round(float(ratios[v, p]), 3),
+                "target": float(targets[p]),
+                "pass": bool(passed[v, p]),
+                "deltaE": round(float(distances[v, p]), 3),
+            })
+
+    return {
+        "source": str(source),
+        "targets": dict(TARGETS, default=DEFAULT_TARGET),
+        "summary": {
+            "variants": len(variants),
+            "pairs": int(passed.size),
+            "failures": int(passed.size - passed.sum()),
+            "min_contrast": round(float(ratios.min()), 3),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit color scheme contrast for every flavour and accent.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON report here (default: stdout)")
+    parser.add_argument("-s", "--source", type=Path, default=BASE_COLORS_FILE, help="Source file")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append", help="Accent (default: all)")
+    parser.add_argument("--failures-only", action="store_true", help="Only list pairs below their target")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any pair fails")
+    args = parser.parse_args()
+
+    report = audit(args.flavour or FLAVORS, args.accent or ACCENTS, args.source)
+    if args.failures_only:
+        report["results"] = [r for r in report["results"] if not r["pass"]]
+
+    text = json.dumps(report, indent=1)
+    if args.output:
+        args.output.write_text(text)
+        summary = report["summary"]
+        print(f"Audited {summary['pairs']} pairs, {summary['failures']} below target -> {args.output}")
+    else:
+        print(text)
+    return 1 if args.strict and report["summary"]["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Benchmark suite for theme loading, building and rendering.
+Every benchmark is timed with timeit (auto-ranged loop count, several repeats,
+garbage collection disabled) and run once more under tracemalloc for its
+Python memory peak. Results are written as JSON; --compare checks them
+against a stored baseline and fails on regressions. The Qt benchmarks run on
+the offscreen platform and are skipped when PyQt is not installed.
+"""
+
+import argparse
+import atexit
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from functools import partial
+from pathlib import Path
+
+from mies.build import build_colors, plan
+from mies.cache import clear_cache
+from mies.palette import ACCENTS
+from mies.paths import FLAVORS, REPO_ROOT
+from mies.recolor import TEMPLATE_DIR, flavor_colors, recolor_stream
+from mies.theme import load_all
+
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.15
+BUTTON_STATES = {"active": (False, False), "hover": (True, False), "pressed": (True, True)}
+
+STARTUP_CODE = """
+from mies.preview import QApplication, ThemeWindow
+app = QApplication([])
+window = ThemeWindow(preload=False)
+window.show()
+app.processEvents()
+"""
+
+
+def has_qt() -> bool:
+    return any(importlib.util.find_spec(name) for name in ("PyQt6", "PyQt5"))
+
+
+# Each benchmark does its setup and returns (callable to time, bytes processed per call)
+
+def theme_load_cold():
+    def run():
+        clear_cache()
+        load_all()
+    return run, None
+
+
+def theme_load_warm():
+    load_all()
+    return load_all, None
+
+
+def colors_matrix():
+    jobs = [job for job in plan(FLAVORS, ACCENTS, ()) if job.kind == "colors"]
+    out_dir = Path(tempfile.mkdtemp(prefix="mies-bench-"))
+    atexit.register(shutil.rmtree, out_dir, ignore_errors=True)
+
+    def run():
+        for job in jobs:
+            build_colors(job, out_dir / Path(job.target).name)
+    return run, None
+
+
+def recolor_decoration():
+    source = (TEMPLATE_DIR / "Modern" / "decoration.svg").read_bytes()
+    colors = {flavor: flavor_colors(flavor) for flavor in FLAVORS}
+
+    def run():
+        recolor_stream(io.BytesIO(source), {flavor: io.BytesIO() for flavor in FLAVORS}, colors)
+    return run, len(source)
+
+
+_qt = {}
+
+
+def _title_bar_button():
+    if not _qt:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from mies import preview
+        app = preview.QApplication.instance() or preview.QApplication(sys.argv[:1])
+        window = preview.ThemeWindow(preload=False)
+        window.show()
+        app.processEvents()
+        _qt.update(preview=preview, app=app, window=window)
+    return _qt["preview"], _qt["window"].title_bar.btn_close
+
+
+def button_paint(state: str):
+    preview, button = _title_bar_button()
+    button.hovered, button.pressed = BUTTON_STATES[state]
+    pixmap = preview.QPixmap(button.size())
+
+    def run():
+        button.render(pixmap)
+    return run, None
+
+
+def preview_startup():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    command = [sys.executable, "-c", STARTUP_CODE]
+
+    def run():
+        subprocess.run(command, cwd=REPO_ROOT, env=env, check=True)
+    return run, None
+
+
+def benchmarks() -> dict:
+    """Every benchmark available here, by name."""
+    found = {
+        "theme_load_cold": theme_load_cold,
+        "theme_load_warm": theme_load_warm,
+        "colors_matrix": colors_matrix,
+        "recolor_decoration": recolor_decoration,
+    }
+    if has_qt():
+        for state in BUTTON_STATES:
+            found[f"button_paint_{state}"] = partial(button_paint, state)
+        found["preview_startup"] = preview_startup
+    return found
+
+
+def measure(setup, repeats: int, memory: bool = True) -> dict:
+    """Time one benchmark and record its memory peak."""
+    run, processed = setup()
+    run()  # warm-up
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeats, number)]
+
+    result = {
+        "min": min(times),
+        "median": statistics.median(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "loops": number,
+        "repeats": repeats,
+    }
+    if processed:
+        result["bytes_per_s"] = processed / result["median"]
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        run()
+        result["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return result
+
+
+def run_suite(names=None, repeats: int = DEFAULT_REPEATS) -> dict:
+    available = benchmarks()
+    results = {}
+    for name, setup in available.items():
+        if names and not any(part in name for part in names):
+            continue
+        results[name] = measure(setup, repeats, memory=name != "preview_startup")
+    return {
+        "created": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Names of the benchmarks whose median got slower than the threshold allows."""
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            print(f"  ? {name}: not in baseline")
+            continue
+        ratio = result["median"] / base["median"]
+        slower = ratio > 1 + threshold
+        if slower:
+            regressions.append(name)
+        print(f"  {'✗' if slower else '✓'} {name}: {base['median'] * 1000:.3f} ms -> "
+              f"{result['median'] * 1000:.3f} ms ({(ratio - 1) * 100:+.1f}%)")
+    return regressions
+
+
+def print_results(report: dict):
+    for name, result in report["benchmarks"].items():
+        line = f"  {name:24} {result['median'] * 1000:10.3f} ms ± {result['stdev'] * 1000:.3f}"
+        if "bytes_per_s" in result:
+            line += f"  {result['bytes_per_s'] / 1e6:.1f} MB/s"
+        if "peak_kb" in result:
+            line += f"  peak {result['peak_kb']:.0f} KiB"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark theme loading, building and rendering.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("-k", "--select", action="append", help="Only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--repeats", type=int, default=DEFAULT_REPEATS, help="Timing repeats per benchmark")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of the median before it counts as a regression (default: 0.15)")
+    args = parser.parse_args()
+
+    report = run_suite(args.select, args.repeats)
+    print_results(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=1))
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        print(f"Compared to {args.compare}:")
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Full-matrix build of every installable artifact.
+Plans color schemes (flavor x accent), Aurorae decorations (flavor x style) and
+LookAndFeel packages with their splash screen (flavor x accent x style) as
+independent jobs, runs them on a process pool and skips every target whose
+inputs still hash to the value recorded in the build manifest.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable
+
+from mies.palette import ACCENTS, BASE_COLORS_FILE, bindings_for, compile_file, scheme_name
+from mies.palette_index import open_index
+from mies.paths import FLAVORS, PALETTE_DIR, REPO_ROOT, STYLES
+from mies.splash import SPLASH_DIR, install_splash, logo_source, preview_source
+from mies.splash import prepare as prepare_splash
+from mies.svgopt import optimize_file
+from mies.templates import LOOKANDFEEL_DIR, TEMPLATES, render
+from mies.templates import bindings_for as lookandfeel_bindings
+from mies.theme import rc_file_for, theme_dir_for
+
+DIST_DIR = REPO_ROOT / "dist"
+MANIFEST_NAME = ".build-manifest.json"
+
+# Changing the build code itself must invalidate every target
+TOOL_FILES = tuple(Path(__file__).parent / name
+                   for name in ("build.py", "palette.py", "palette_index.py", "splash.py", "svgopt.py",
+                               "templates.py"))
+
+
+@dataclass(frozen=True)
+class Job:
+    """One build target, relative to the output root."""
+
+    kind: str
+    target: str
+    flavor: str
+    accent: str = ""
+    style: str = ""
+
+    def inputs(self) -> list:
+        """Source files this target is generated from."""
+        if self.kind == "colors":
+            files = [BASE_COLORS_FILE, PALETTE_DIR / f"{self.flavor}.sed"]
+        elif self.kind == "aurorae":
+            files = _tree(theme_dir_for(self.flavor, self.style))
+            files.append(rc_file_for(self.flavor, self.style))
+        else:
+            files = _tree(LOOKANDFEEL_DIR / f"Catppuccin-{self.flavor}-Global")
+            files += [TEMPLATES[name] for name in ("metadata.desktop", "metadata.json", "contents/defaults")]
+            files += [SPLASH_DIR / "Splash.qml", SPLASH_DIR / "images" / "busywidget.svg",
+                      logo_source(self.flavor), preview_source(self.flavor),
+                      PALETTE_DIR / f"{self.flavor}.sed"]
+        return files + list(TOOL_FILES)
+
+
+def _tree(root: Path) -> list:
+    return sorted(p for p in root.rglob("*") if p.is_file())
+
+
+def plan(flavors: Iterable[str] = FLAVORS, accents: Iterable[str] = ACCENTS,
+         styles: Iterable[str] = STYLES) -> list:
+    """Plan every job of the flavor x accent x style matrix."""
+    flavors, accents, styles = list(flavors), list(accents), list(styles)
+    jobs = []
+    for flavor in flavors:
+        for accent in accents:
+            jobs.append(Job("colors", f"color-schemes/{scheme_name(flavor, accent)}", flavor, accent))
+        for style in styles:
+            jobs.append(Job("aurorae", f"aurorae/themes/Catppuccin{flavor}-{style}", flavor, style=style))
+            for accent in accents:
+                jobs.append(Job("lookandfeel", f"look-and-feel/{style}/Catppuccin-{flavor}-{accent}",
+                                flavor, accent, style))
+    return jobs
+
+
+def job_digest(job: Job, file_digests: dict) -> str:
+    """Hash of the job parameters and the content of all of its inputs."""
+    h = hashlib.sha256(json.dumps(asdict(job), sort_keys=True).encode())
+    for path in job.inputs():
+        if path not in file_digests:
+            file_digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        h.update(str(path.relative_to(REPO_ROOT)).encode())
+        h.update(file_digests[path].encode())
+    return h.hexdigest()
+
+
+def build_colors(job: Job, out: Path):
+    template = compile_file(BASE_COLORS_FILE)
+    out.write_bytes(template.render(bindings_for(job.flavor, job.accent)).encode("utf-8"))
+
+
+def build_aurorae(job: Job, out: Path):
+    theme_dir = theme_dir_for(job.flavor, job.style)
+    shutil.copytree(theme_dir, out)
+    optimize_file(theme_dir / "decoration.svg", out / "decoration.svg")
+    shutil.copy2(rc_file_for(job.flavor, job.style), out / f"Catppuccin{job.flavor}-{job.style}rc")
+
+
+def build_lookandfeel(job: Job, out: Path):
+    flavor, accent, style = job.flavor, job.accent, job.style
+    shutil.copytree(LOOKANDFEEL_DIR / f"Catppuccin-{flavor}-Global", out)
+
+    # Metadata and defaults, as InstallGlobalTheme in install.sh
+    bindings = lookandfeel_bindings(flavor, accent, style)
+    for name in ("metadata.desktop", "metadata.json", "contents/defaults"):
+        (out / name).write_bytes(render(TEMPLATES[name], bindings).encode("utf-8"))
+
+    # Splash screen, as BuildSplashScreen in install.sh
+    images = out / "contents" / "splash" / "images"
+    images.mkdir(parents=True)
+    palette_bindings = bindings_for(flavor, accent)
+    palette_bindings["REPLACE--ACCENT"] = palette_bindings["--accentColor"]
+    busywidget = compile_file(SPLASH_DIR / "images" / "busywidget.svg", ["REPLACE--ACCENT"])
+    (images / "busywidget.svg").write_bytes(busywidget.render(palette_bindings).encode("utf-8"))
+    # Pre-scaled logos and the preview come from the shared splash asset cache
+    previews = out / "contents" / "previews"
+    previews.mkdir(parents=True, exist_ok=True)
+    qml = compile_file(SPLASH_DIR / "Splash.qml", ["REPLACE--MANTLE"])
+    qml = install_splash(flavor, images, previews, qml.render({"REPLACE--MANTLE": open_index().hex(flavor, "mantle")}))
+    (out / "contents" / "splash" / "Splash.qml").write_bytes(qml.encode("utf-8"))
+
+
+BUILDERS = {"colors": build_colors, "aurorae": build_aurorae, "lookandfeel": build_lookandfeel}
+
+
+def replace_atomic(staged: Path, target: Path):
+    """Move a staged file or directory into place with renames only."""
+    if staged.is_dir() and target.exists():
+        old = target.with_name(f".{target.name}.old-{os.getpid()}")
+        os.replace(target, old)
+        os.replace(staged, target)
+        shutil.rmtree(old)
+    else:
+        os.replace(staged, target)
+
+
+def run_job(job: Job, out_root: Path) -> Job:
+    """Build a job into a staging path next to its target and swap it in."""
+    target = out_root / job.target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    try:
+        staged = staging / target.name
+        BUILDERS[job.kind](job, staged)
+        replace_atomic(staged, target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return job
+
+
+def load_manifest(out_root: Path) -> dict:
+    try:
+        return json.loads((out_root / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(out_root: Path, manifest: dict):
+    tmp = out_root / f"{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, out_root / MANIFEST_NAME)
+
+
+def build(out_root: Path, jobs: list, workers: int = None, force: bool = False) -> tuple:
+    """Run every out-of-date job. Returns (built, skipped) job lists."""
+    out_root.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(out_root)
+    file_digests = {}
+    digests = {job: job_digest(job, file_digests) for job in jobs}
+
+    stale = [job for job in jobs
+             if force or manifest.get(job.target) != digests[job] or not (out_root / job.target).exists()]
+    skipped = [job for job in jobs if job not in stale]
+
+    built = []
+    if stale:
+        # Scale each splash logo once, in parallel, before the packages copy them
+        splash_flavors = {job.flavor for job in stale if job.kind == "lookandfeel"}
+        if splash_flavors:
+            prepare_splash(sorted(splash_flavors), workers=workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job in pool.map(run_job, stale, [out_root] * len(stale), chunksize=4):
+                manifest[job.target] = digests[job]
+                built.append(job)
+        save_manifest(out_root, manifest)
+    return built, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build every Catppuccin artifact in parallel.")
+    parser.add_argument("-o", "--output", type=Path, default=DIST_DIR, help="Output directory")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append", help="Accent (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append", help="Window decoration style (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    jobs = plan(args.flavour or FLAVORS, args.accent or ACCENTS, args.style or STYLES)
+    built, skipped = build(args.output, jobs, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"Built {len(built)}, up to date {len(skipped)} of {len(jobs)} targets in {elapsed:.2f}s -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
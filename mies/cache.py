@@ -0,0 +1,40 @@
+"""
+mtime-keyed parse cache shared by the tools.
+A file is parsed once per process and the result reused until the file's
+mtime changes. Cached results are shared, so callers must not mutate them.
+"""
+
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+from mies.trace import span
+
+T = TypeVar("T")
+
+# (path, parser name) -> (mtime_ns, parsed result)
+_parse_cache: dict = {}
+
+
+def cached_parse(path: Path, parser: Callable[[str], T]) -> Optional[T]:
+    """Parse a file once and reuse the result until its mtime changes."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    key = (path, parser.__name__)
+    hit = _parse_cache.get(key)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+
+    with span("read", path=path.name):
+        content = path.read_text()
+    with span(f"parse {parser.__name__}", path=path.name):
+        result = parser(content)
+    _parse_cache[key] = (mtime, result)
+    return result
+
+
+def clear_cache():
+    """Drop every memoized parse result."""
+    _parse_cache.clear()
@@ -0,0 +1,457 @@
+"""
+Incremental consistency checker for the theme sources.
+The rc files, button and decoration SVGs, Aurorae metadata, `.sed` palettes,
+PALETTE.md, Base.colors, `.kwinrule` files and LookAndFeel templates are each
+reduced to a few facts (button sizes, state ids, fills, names, placeholders),
+and invariants are checked across them: button SVGs against ButtonWidth /
+ButtonHeight, fills and text colors against the palettes, the ThemeConfig
+fallbacks against the default rc file, and so on.
+
+Facts are cached in .mies-check-cache.json keyed by each file's content hash,
+together with the result of every invariant. Files whose size and mtime are
+unchanged are not read, and only the invariants depending on a file whose
+content changed are re-checked, so a run over an unchanged tree reads nothing
+and is quick enough for a pre-commit hook.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from mies.kconfig import KConfig, unescape
+from mies.palette_index import COLOR_NAMES, MARKDOWN_FILE, parse_sed
+from mies.palette import BASE_COLORS_FILE
+from mies.paths import FLAVORS, PALETTE_DIR, REPO_ROOT, STYLES
+from mies.templates import PLACEHOLDER_RE, PLACEHOLDERS, TEMPLATES
+from mies.theme import ATTR_RE, BUTTONS, RC_KEYS, STATE_GROUP_RE, rc_file_for, theme_dir_for
+
+CACHE_FILE = REPO_ROOT / ".mies-check-cache.json"
+CACHE_VERSION = 1
+RULESET_DIR = REPO_ROOT / "kwinruleset"
+THEME_MODULE = Path(__file__).resolve().parent / "theme.py"
+
+# Fact extraction depends on these; editing one invalidates the whole cache
+TOOL_FILES = [Path(__file__).resolve(), THEME_MODULE,
+              THEME_MODULE.parent / "templates.py", THEME_MODULE.parent / "kconfig.py",
+              THEME_MODULE.parent / "palette_index.py"]
+
+BUTTON_STATES = ("active-center", "hover-center", "pressed-center",
+                 "inactive-center", "hover-inactive-center", "deactivated-center")
+DECORATION_IDS = tuple(f"decoration-{part}" for part in (
+    "topleft", "top", "topright", "left", "center", "right", "bottomleft", "bottom", "bottomright"))
+# ThemeConfig values used when an rc file is missing; they must match the default theme
+FALLBACK_FIELDS = ("button_width", "button_height", "button_spacing", "title_height",
+                   "active_text_color", "inactive_text_color")
+DEFAULT_THEME = ("Mocha", "Modern")
+
+ID_RE = re.compile(r'\bid="([^"]*)"')
+COLOR_REF_RE = re.compile(r'\$(\w+)')
+MARKDOWN_HEADING_RE = re.compile(r'^## (\w+)$')
+MARKDOWN_ROW_RE = re.compile(r'^\| (\w+)\s*\| (#[0-9a-fA-F]{6})\s*\|')
+
+
+# Fact extractors: file content -> JSON-serializable facts
+
+def rc_facts(content: str) -> dict:
+    """The RC_KEYS values an rc file sets, by ThemeConfig field."""
+    config = KConfig(content)
+    facts = {}
+    for group in ("General", "Layout"):
+        for key, value in config.group(group).items():
+            if key in RC_KEYS:
+                facts[RC_KEYS[key][0]] = value
+    return facts
+
+
+def button_facts(content: str) -> dict:
+    """Size and fill of the first rect of every state group."""
+    states = {}
+    for group_id, attrs in STATE_GROUP_RE.findall(content):
+        attr = dict(ATTR_RE.findall(attrs))
+        states[group_id] = [attr.get("width"), attr.get("height"), attr.get("fill")]
+    return states
+
+
+def decoration_facts(content: str) -> list:
+    return sorted(i for i in set(ID_RE.findall(content)) if i.startswith("decoration-"))
+
+
+def desktop_name_facts(content: str) -> str:
+    return KConfig(content).get("Desktop Entry", "X-KDE-PluginInfo-Name")
+
+
+def json_id_facts(content: str) -> str:
+    return json.loads(content).get("KPlugin", {}).get("Id")
+
+
+def sed_facts(content: str) -> dict:
+    """Hex colors of a palette; unparsable values are kept as they are."""
+    palette = {}
+    for name, value in parse_sed(content).items():
+        try:
+            r, g, b = (int(part) for part in value.split(","))
+            palette[name] = f"#{r:02x}{g:02x}{b:02x}"
+        except ValueError:
+            palette[name] = value
+    return palette
+
+
+def markdown_facts(content: str) -> dict:
+    """Hex colors per flavor from the PALETTE.md tables."""
+    tables = {}
+    rows = None
+    for line in content.splitlines():
+        heading = MARKDOWN_HEADING_RE.match(line)
+        if heading:
+            rows = tables.setdefault(heading.group(1), {})
+        elif rows is not None:
+            row = MARKDOWN_ROW_RE.match(line)
+            if row and row.group(1) != "Name":
+                rows[row.group(1).lower()] = row.group(2).lower()
+    return tables
+
+
+def color_ref_facts(content: str) -> list:
+    return sorted(set(COLOR_REF_RE.findall(content)))
+
+
+def kwinrule_facts(content: str) -> list:
+    """[name, wmclassmatch, unescaped wmclass] of every rule."""
+    rules = []
+    for group, keys in KConfig(content).groups.items():
+        if group and keys:
+            rules.append([keys.get("Description", "][".join(group)),
+                          keys.get("wmclassmatch", "0"), unescape(keys.get("wmclass", ""))])
+    return rules
+
+
+def placeholder_facts(content: str) -> list:
+    return sorted(set(PLACEHOLDER_RE.findall(content)))
+
+
+def theme_config_facts(content: str) -> dict:
+    """Literal defaults of the ThemeConfig dataclass, read from the source."""
+    for node in ast.walk(ast.parse(content)):
+        if isinstance(node, ast.ClassDef) and node.name == "ThemeConfig":
+            return {item.target.id: ast.literal_eval(item.value) for item in node.body
+                    if isinstance(item, ast.AnnAssign) and isinstance(item.value, ast.Constant)}
+    return {}
+
+
+# Invariants: facts of the inputs, in order -> problems
+
+def _size(value, fallback=None):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return fallback
+
+
+def check_buttons(names: list, rc: dict, *svgs) -> list:
+    """Every state of every button SVG is drawn at the rc button size."""
+    problems = []
+    width, height = _size(rc.get("button_width")), _size(rc.get("button_height"))
+    if width is None or height is None:
+        return ["rc file sets no valid ButtonWidth/ButtonHeight"]
+    for name, states in zip(names, svgs):
+        missing = [state for state in BUTTON_STATES if state not in states]
+        if missing:
+            problems.append(f"{name} has no {', '.join(missing)}")
+        sizes = {(_size(w), _size(h)) for w, h, _ in states.values()}
+        for w, h in sorted(sizes - {(width, height)}, key=str):
+            problems.append(f"{name} draws {w}x{h} buttons, the rc file says {width}x{height}")
+    return problems
+
+
+def check_button_fills(names: list, palette: dict, *svgs) -> list:
+    """Every state fill is a color of the flavor's palette."""
+    colors = set(palette.values())
+    problems = []
+    for name, states in zip(names, svgs):
+        for state, (_, _, fill) in states.items():
+            if fill and fill.lower() not in colors:
+                problems.append(f"{name} {state} fill {fill} is not in the palette")
+    return problems
+
+
+def check_decoration(ids: list) -> list:
+    return [f"decoration.svg has no {part}" for part in DECORATION_IDS if part not in ids]
+
+
+def check_metadata(theme: str, desktop_name: str, json_id: str) -> list:
+    problems = []
+    if desktop_name != theme:
+        problems.append(f"metadata.desktop X-KDE-PluginInfo-Name is {desktop_name}, not {theme}")
+    if json_id != theme:
+        problems.append(f"metadata.json KPlugin.Id is {json_id}, not {theme}")
+    return problems
+
+
+def check_text_colors(rc: dict, *palettes) -> list:
+    """Title colors come from the palette of a flavor using the rc file."""
+    colors = set().union(*(palette.values() for palette in palettes))
+    return [f"{field} {rc[field]} is not in the palette" for field in ("active_text_color", "inactive_text_color")
+            if field in rc and rc[field].lower() not in colors]
+
+
+def check_fallbacks(defaults: dict, rc: dict) -> list:
+    """The ThemeConfig defaults the preview falls back to match the default theme."""
+    problems = []
+    for field in FALLBACK_FIELDS:
+        value = rc.get(field)
+        if isinstance(defaults.get(field), int):
+            value = _size(value, value)
+        if field in defaults and value != defaults[field]:
+            problems.append(f"ThemeConfig.{field} is {defaults[field]!r}, the default rc file says {value!r}")
+    return problems
+
+
+def check_palette_table(table: dict, *palettes) -> list:
+    """The .sed palettes are complete and PALETTE.md shows them."""
+    problems = []
+    for flavor, palette in zip(FLAVORS, palettes):
+        missing = [name for name in COLOR_NAMES if name not in palette]
+        if missing:
+            problems.append(f"{flavor}.sed is missing {', '.join(missing)}")
+        shown = table.get(flavor, {})
+        for name in COLOR_NAMES:
+            if name in palette and shown.get(name) != palette[name]:
+                problems.append(f"PALETTE.md shows {flavor} {name} as {shown.get(name)}, "
+                                f"{flavor}.sed has {palette[name]}")
+    return problems
+
+
+def check_color_refs(refs: list, *palettes) -> list:
+    """Every $name of Base.colors is defined by every palette."""
+    problems = []
+    for flavor, palette in zip(FLAVORS, palettes):
+        missing = [ref for ref in refs if ref not in palette]
+        if missing:
+            problems.append(f"{flavor}.sed does not define {', '.join('$' + ref for ref in missing)}")
+    return problems
+
+
+def check_kwinrules(rules: list) -> list:
+    problems = []
+    for name, match, wmclass in rules:
+        if match not in ("0", "1", "2", "3"):
+            problems.append(f"'{name}' has unknown wmclassmatch {match}")
+        elif match == "3":
+            try:
+                re.compile(wmclass)
+            except re.error as e:
+                problems.append(f"'{name}' has a bad regex {wmclass!r}: {e}")
+    return problems
+
+
+def check_placeholders(names: list, *templates) -> list:
+    problems = []
+    for name, found in zip(names, templates):
+        unknown = sorted(set(found) - set(PLACEHOLDERS))
+        if unknown:
+            problems.append(f"{name} uses unknown placeholders {', '.join(unknown)}")
+    return problems
+
+
+@dataclass(frozen=True)
+class Invariant:
+    """A check over the facts of its input files."""
+
+    name: str
+    inputs: tuple  # (path, extractor) pairs
+    check: Callable
+
+
+def invariants() -> list:
+    """Every invariant of the tree, with the files it depends on."""
+    def sed(flavor):
+        return PALETTE_DIR / f"{flavor}.sed", sed_facts
+
+    found = []
+    for flavor in FLAVORS:
+        for style in STYLES:
+            theme_dir = theme_dir_for(flavor, style)
+            rc = rc_file_for(flavor, style), rc_facts
+            svgs = tuple((theme_dir / f"{button}.svg", button_facts) for button in BUTTONS)
+            names = [f"{button}.svg" for button in BUTTONS]
+            found += [
+                Invariant(f"{theme_dir.name} button sizes", (rc, *svgs), partial(check_buttons, names)),
+                Invariant(f"{theme_dir.name} button colors", (sed(flavor), *svgs),
+                          partial(check_button_fills, names)),
+                Invariant(f"{theme_dir.name} decoration", ((theme_dir / "decoration.svg", decoration_facts),),
+                          check_decoration),
+                Invariant(f"{theme_dir.name} metadata", ((theme_dir / "metadata.desktop", desktop_name_facts),
+                                                         (theme_dir / "metadata.json", json_id_facts)),
+                          partial(check_metadata, theme_dir.name)),
+            ]
+
+    users = {}
+    for flavor in FLAVORS:
+        for style in STYLES:
+            users.setdefault(rc_file_for(flavor, style), []).append(flavor)
+    for rc, flavors in users.items():
+        found.append(Invariant(f"{rc.name} text colors", ((rc, rc_facts), *(sed(flavor) for flavor in flavors)),
+                               check_text_colors))
+
+    palettes = tuple(sed(flavor) for flavor in FLAVORS)
+    found += [
+        Invariant("ThemeConfig fallbacks", ((THEME_MODULE, theme_config_facts),
+                                            (rc_file_for(*DEFAULT_THEME), rc_facts)), check_fallbacks),
+        Invariant("PALETTE.md", ((MARKDOWN_FILE, markdown_facts), *palettes), check_palette_table),
+        Invariant("Base.colors", ((BASE_COLORS_FILE, color_ref_facts), *palettes), check_color_refs),
+        Invariant("LookAndFeel placeholders", tuple((path, placeholder_facts) for path in TEMPLATES.values()),
+                  partial(check_placeholders, list(TEMPLATES))),
+    ]
+    for path in sorted(RULESET_DIR.glob("*.kwinrule")):
+        found.append(Invariant(f"{path.name} rules", ((path, kwinrule_facts),), check_kwinrules))
+    return found
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def tool_digest() -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for path in TOOL_FILES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cache(path: Path, tool: str) -> dict:
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {"files": {}, "results": {}}
+    if cache.get("tool") != tool:
+        return {"files": {}, "results": {}}
+    return cache
+
+
+def save_cache(path: Path, cache: dict):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_text(json.dumps(cache, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+@dataclass
+class Report:
+    problems: dict     # invariant name -> problems
+    files: int
+    invariants: int
+    read: int          # files whose content was read and hashed
+    rechecked: list    # invariants run this time
+    changed: list      # files whose content changed since the cache was written
+    elapsed: float
+
+
+def run(cache_path: Path = CACHE_FILE, use_cache: bool = True) -> Report:
+    """Check every invariant, re-checking only those whose inputs changed."""
+    start = time.perf_counter()
+    tool = tool_digest()
+    cache = load_cache(cache_path, tool) if use_cache else {"files": {}, "results": {}}
+    old_files, old_results = cache["files"], cache["results"]
+
+    checks = invariants()
+    # Dependency graph: file -> invariants reading it
+    sources, dependents = {}, {}
+    for invariant in checks:
+        for path, extractor in invariant.inputs:
+            sources[_rel(path)] = (path, extractor)
+            dependents.setdefault(_rel(path), []).append(invariant.name)
+
+    files, changed, read = {}, [], 0
+    for rel, (path, extractor) in sources.items():
+        entry = old_files.get(rel)
+        try:
+            st = path.stat()
+        except OSError:
+            files[rel] = None
+            if rel in old_files:
+                changed.append(rel)
+            continue
+        stat = [st.st_size, st.st_mtime_ns]
+        if entry is not None and entry["stat"] == stat:
+            files[rel] = entry
+            continue
+        data = path.read_bytes()
+        read += 1
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry["digest"] == digest:
+            files[rel] = dict(entry, stat=stat)  # touched, not edited
+            continue
+        files[rel] = {"stat": stat, "digest": digest}
+        try:
+            files[rel]["facts"] = extractor(data.decode("utf-8"))
+        except (ValueError, SyntaxError) as e:
+            files[rel]["error"] = f"{rel} could not be parsed: {e}"
+        changed.append(rel)
+
+    touched = {name for rel in changed for name in dependents[rel]}
+    results, rechecked = {}, []
+    for invariant in checks:
+        rels = [_rel(path) for path, _ in invariant.inputs]
+        cached = old_results.get(invariant.name)
+        if invariant.name not in touched and cached is not None and cached["inputs"] == rels:
+            results[invariant.name] = cached
+            continue
+        rechecked.append(invariant.name)
+        missing = [rel for rel in rels if files[rel] is None]
+        errors = [files[rel]["error"] for rel in rels if files[rel] is not None and "error" in files[rel]]
+        if missing or errors:
+            problems = [f"{rel} is missing" for rel in missing] + errors
+        else:
+            problems = invariant.check(*(files[rel]["facts"] for rel in rels))
+        results[invariant.name] = {"inputs": rels, "problems": problems}
+
+    if use_cache and (read or rechecked or len(files) != len(old_files) or len(results) != len(old_results)):
+        save_cache(cache_path, {"tool": tool, "files": {rel: entry for rel, entry in files.items() if entry},
+                                "results": results})
+
+    return Report(
+        problems={name: result["problems"] for name, result in results.items() if result["problems"]},
+        files=len(files),
+        invariants=len(checks),
+        read=read,
+        rechecked=rechecked,
+        changed=changed,
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the theme sources for cross-file consistency.")
+    parser.add_argument("--cache", type=Path, default=CACHE_FILE, help=f"Fact cache (default: {_rel(CACHE_FILE)})")
+    parser.add_argument("--no-cache", action="store_true", help="Check everything, without reading or writing the cache")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List changed files and re-checked invariants")
+    args = parser.parse_args()
+
+    report = run(args.cache, not args.no_cache)
+    if args.verbose:
+        for rel in report.changed:
+            print(f"  changed    {rel}")
+        for name in report.rechecked:
+            print(f"  re-checked {name}")
+    for name, problems in report.problems.items():
+        for problem in problems:
+            print(f"  ✗ {name}: {problem}")
+    count = sum(len(problems) for problems in report.problems.values())
+    print(f"{report.files} files ({report.read} read), {report.invariants} invariants "
+          f"({len(report.rechecked)} re-checked), {count} problems in {report.elapsed * 1000:.1f} ms")
+    return 1 if count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+Transactional installer for a flavor/accent/style selection.
+The color scheme, Aurorae decoration and LookAndFeel package (with its splash
+screen) are generated with the mies.build builders, every file is stored once
+in a content-addressed blob store, and only files whose content changed are
+written to the data directory, each through a temp file and an atomic rename.
+Each install is recorded in a manifest: files of the previous install that
+are no longer part of the selection are removed, a failed install is rolled
+back, and earlier manifests can be restored with --rollback. The manifest also
+records size, mtime and hash of every source file, so reinstalling an
+unchanged selection is a no-op that only stats the source and installed files.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mies.build import BUILDERS, Job, job_digest, plan
+from mies.palette import ACCENTS
+from mies.paths import FLAVORS, REPO_ROOT, STYLES
+
+DATA_HOME = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+STATE_DIR_NAME = "catppuccin-mies"
+KEEP_MANIFESTS = 5
+
+# Where install.sh puts each kind of artifact, relative to the data directory
+DESTINATIONS = {
+    "colors": Path("color-schemes"),
+    "aurorae": Path("aurorae/themes"),
+    "lookandfeel": Path("plasma/look-and-feel"),
+}
+
+
+def destination(job: Job) -> str:
+    return str(DESTINATIONS[job.kind] / Path(job.target).name)
+
+
+def object_path(state: Path, digest: str) -> Path:
+    return state / "objects" / digest[:2] / digest[2:]
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _write_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def manifest_ids(state: Path) -> list:
+    return sorted(int(p.stem) for p in (state / "manifests").glob("*.json"))
+
+
+def load_manifest(state: Path, manifest_id: int = None) -> dict:
+    """A recorded manifest, by default the one currently installed."""
+    try:
+        if manifest_id is None:
+            manifest_id = int((state / "current").read_text())
+        return json.loads((state / "manifests" / f"{manifest_id:06d}.json").read_text())
+    except (OSError, ValueError):
+        return {"id": 0, "jobs": {}, "files": {}}
+
+
+def save_manifest(state: Path, manifest: dict):
+    """Record a manifest, make it current and drop the oldest ones."""
+    _write_json(state / "manifests" / f"{manifest['id']:06d}.json", manifest)
+    tmp = state / ".current.tmp"
+    tmp.write_text(str(manifest["id"]))
+    os.replace(tmp, state / "current")
+
+    ids = manifest_ids(state)
+    for old in ids[:-KEEP_MANIFESTS]:
+        (state / "manifests" / f"{old:06d}.json").unlink()
+    collect_garbage(state)
+
+
+def collect_garbage(state: Path):
+    """Delete blobs no kept manifest refers to."""
+    live = {entry["digest"] for i in manifest_ids(state) for entry in load_manifest(state, i)["files"].values()}
+    for blob in (state / "objects").glob("*/*"):
+        if blob.parent.name + blob.name not in live:
+            blob.unlink()
+
+
+def stage(jobs: list, state: Path) -> dict:
+    """Generate the jobs and move every file into the blob store. Returns the file entries."""
+    files = {}
+    staging = Path(tempfile.mkdtemp(prefix=".staging.", dir=state))
+    try:
+        for job in jobs:
+            out = staging / Path(job.target).name
+            BUILDERS[job.kind](job, out)
+            paths = [out] if out.is_file() else sorted(p for p in out.rglob("*") if p.is_file())
+            for path in paths:
+                digest = file_digest(path)
+                blob = object_path(state, digest)
+                if not blob.exists():
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(path, blob)
+                rel = Path(destination(job)) / path.relative_to(out) if path != out else Path(destination(job))
+                files[str(rel)] = {"digest": digest}
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return files
+
+
+def is_installed(data_home: Path, entry: dict, rel: str) -> bool:
+    """Whether a file is still exactly as the installer left it."""
+    try:
+        st = os.stat(data_home / rel)
+    except OSError:
+        return False
+    return st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns")
+
+
+def materialize(data_home: Path, state: Path, rel: str, digest: str) -> dict:
+    """Write one blob to its place with a temp file and an atomic rename."""
+    target = data_home / rel
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as out, object_path(state, digest).open("rb") as blob:
+            shutil.copyfileobj(blob, out)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    st = target.stat()
+    return {"digest": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def remove(data_home: Path, rel: str):
+    """Delete an installed file and the directories it leaves empty."""
+    target = data_home / rel
+    target.unlink(missing_ok=True)
+    roots = {data_home / root for root in DESTINATIONS.values()}
+    parent = target.parent
+    while parent not in roots and parent != data_home and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+def apply(data_home: Path, state: Path, old: dict, new: dict) -> tuple:
+    """Move the data directory from the old file set to the new one.
+    On failure everything already changed is restored from the blob store."""
+    done = {}
+    written, removed = [], []
+    try:
+        for rel, entry in new.items():
+            if old.get(rel, {}).get("digest") == entry["digest"] and is_installed(data_home, old[rel], rel):
+                done[rel] = old[rel]
+                continue
+            done[rel] = materialize(data_home, state, rel, entry["digest"])
+            written.append(rel)
+        for rel in old.keys() - new.keys():
+            remove(data_home, rel)
+            removed.append(rel)
+    except BaseException:
+        print("Error: install failed, restoring the previous files")
+        for rel in written:
+            if rel in old:
+                materialize(data_home, state, rel, old[rel]["digest"])
+            else:
+                remove(data_home, rel)
+        for rel in removed:
+            materialize(data_home, state, rel, old[rel]["digest"])
+        raise
+    return done, written, removed
+
+
+def known_digests(jobs: list, recorded: dict) -> tuple:
+    """Hashes of the job inputs whose size and mtime match the recorded ones, so
+    job_digest does not read them, and the stat records for the next manifest."""
+    file_digests, inputs = {}, {}
+    for path in {path for job in jobs for path in job.inputs()}:
+        rel = str(path.relative_to(REPO_ROOT))
+        st = path.stat()
+        entry = recorded.get(rel)
+        if entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            file_digests[path] = entry["digest"]
+        inputs[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    return file_digests, inputs
+
+
+def install(flavor: str, accent: str, style: str, data_home: Path = DATA_HOME, force: bool = False) -> tuple:
+    """Install one selection. Returns (written, removed) relative paths."""
+    state = data_home / STATE_DIR_NAME
+    state.mkdir(parents=True, exist_ok=True)
+    current = load_manifest(state)
+
+    jobs = plan([flavor], [accent], [style])
+    file_digests, inputs = known_digests(jobs, current.get("inputs", {}))
+    digests = {destination(job): job_digest(job, file_digests) for job in jobs}
+    for path, digest in file_digests.items():
+        inputs[str(path.relative_to(REPO_ROOT))]["digest"] = digest
+    if (not force and digests == current["jobs"]
+            and all(is_installed(data_home, entry, rel) for rel, entry in current["files"].items())):
+        if inputs != current.get("inputs"):
+            save_manifest(state, dict(current, inputs=inputs))
+        return [], []
+
+    files, written, removed = apply(data_home, state, current["files"], stage(jobs, state))
+    save_manifest(state, {
+        "id": max(manifest_ids(state), default=0) + 1,
+        "created": time.time(),
+        "selection": {"flavor": flavor, "accent": accent, "style": style},
+        "jobs": digests,
+        "inputs": inputs,
+        "files": files,
+    })
+    return written, removed
+
+
+def rollback(data_home: Path = DATA_HOME) -> tuple:
+    """Restore the install recorded before the current one."""
+    state = data_home / STATE_DIR_NAME
+    current = load_manifest(state)
+    earlier = [i for i in manifest_ids(state) if i < current["id"]]
+    if not earlier:
+        raise ValueError("No earlier install to roll back to")
+    previous = load_manifest(state, earlier[-1])
+
+    files, written, removed = apply(data_home, state, current["files"], previous["files"])
+    # Drop the current manifest so repeated rollbacks keep going back
+    (state / "manifests" / f"{current['id']:06d}.json").unlink()
+    save_manifest(state, dict(previous, files=files))
+    return written, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install a Catppuccin selection into the user's data directory.")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, help="Flavour")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, help="Accent")
+    parser.add_argument("-s", "--style", choices=STYLES, help="Window decoration style")
+    parser.add_argument("-d", "--data-home", type=Path, default=DATA_HOME,
+                        help="Data directory (default: $XDG_DATA_HOME or ~/.local/share)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if nothing changed")
+    parser.add_argument("--rollback", action="store_true", help="Restore the previous install")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        if args.rollback:
+            written, removed = rollback(args.data_home)
+        elif args.flavour and args.accent and args.style:
+            written, removed = install(args.flavour, args.accent, args.style, args.data_home, args.force)
+        else:
+            parser.error("--flavour, --accent and --style are required unless --rollback is given")
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    elapsed = time.perf_counter() - start
+    if written or removed:
+        print(f"Wrote {len(written)}, removed {len(removed)} files in {elapsed:.2f}s -> {args.data_home}")
+    else:
+        print(f"Already up to date ({elapsed:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Reader and writer for KDE config syntax (Aurorae rc, .colors, .desktop,
+.kwinrule and the LookAndFeel defaults).
+A file is parsed in a single pass into groups and keys while every line is
+kept verbatim, so an unchanged file serializes byte-identically and setting a
+key only rewrites that key's line. Nested headers such as
+`[kwinrc][org.kde.kdecoration2]` become tuple group names.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+from mies.cache import cached_parse
+
+GROUP_RE = re.compile(r'\[([^\]]*)\]')
+ESCAPE_RE = re.compile(r'\\(.)')
+UNESCAPES = {"\\": "\\", "s": " ", "t": "\t", "n": "\n", "r": "\r"}
+
+Group = Union[str, tuple]
+
+
+def _group(group: Group) -> tuple:
+    return group if isinstance(group, tuple) else (group,)
+
+
+class KConfig:
+    """Groups and keys of a KDE config file, keeping its original lines."""
+
+    def __init__(self, content: str = ""):
+        self.lines = content.splitlines(keepends=True)
+        self.groups = {(): {}}  # keys before the first header live in ()
+        self._key_lines = {}    # (group, key) -> line number
+        self._group_ends = {}   # group -> line number after its last header or key
+
+        group = ()
+        for n, line in enumerate(self.lines):
+            text = line.strip()
+            if not text or text[0] == '#':
+                continue
+            if text[0] == '[' and text[-1] == ']':
+                group = tuple(GROUP_RE.findall(text))
+                self.groups.setdefault(group, {})
+                self._group_ends[group] = n + 1
+                continue
+            key, sep, value = text.partition('=')
+            if sep:
+                key = key.strip()
+                self.groups[group][key] = value.strip()
+                self._key_lines[(group, key)] = n
+                self._group_ends[group] = n + 1
+
+    def __str__(self) -> str:
+        return "".join(self.lines)
+
+    def __contains__(self, group: Group) -> bool:
+        return _group(group) in self.groups
+
+    def group(self, group: Group) -> Mapping[str, str]:
+        """Read-only view of the keys of a group."""
+        return MappingProxyType(self.groups.get(_group(group), {}))
+
+    def get(self, group: Group, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.groups.get(_group(group), {}).get(key, default)
+
+    def set(self, group: Group, key: str, value: str):
+        """Set a key, rewriting its line or adding it at the end of its group."""
+        group = _group(group)
+        newline = self._newline()
+        if (group, key) in self._key_lines:
+            n = self._key_lines[(group, key)]
+            old = self.lines[n]
+            ending = old[len(old.rstrip("\r\n")):]
+            self.lines[n] = f"{key}={value}{ending}"
+        elif group in self._group_ends:
+            last = self._group_ends[group] - 1
+            if not self.lines[last].endswith(("\n", "\r")):
+                self.lines[last] += newline
+            self._insert(self._group_ends[group], f"{key}={value}{newline}")
+            self._key_lines[(group, key)] = self._group_ends[group] - 1
+        else:
+            if self.lines and not self.lines[-1].endswith(("\n", "\r")):
+                self.lines[-1] += newline
+            if self.lines and self.lines[-1].strip():
+                self.lines.append(newline)
+            if group:
+                self.lines.append("".join(f"[{name}]" for name in group) + newline)
+            self.lines.append(f"{key}={value}{newline}")
+            self.groups.setdefault(group, {})
+            self._key_lines[(group, key)] = len(self.lines) - 1
+            self._group_ends[group] = len(self.lines)
+        self.groups[group][key] = value
+
+    def write(self, path: Path):
+        """Write the file with a temp file and an atomic rename."""
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_bytes(str(self).encode("utf-8"))
+        os.replace(tmp, path)
+
+    def _newline(self) -> str:
+        for line in self.lines:
+            if line.endswith("\r\n"):
+                return "\r\n"
+            if line.endswith("\n"):
+                return "\n"
+        return "\n"
+
+    def _insert(self, n: int, line: str):
+        self.lines.insert(n, line)
+        for key, index in self._key_lines.items():
+            if index >= n:
+                self._key_lines[key] = index + 1
+        for group, index in self._group_ends.items():
+            if index >= n:
+                self._group_ends[group] = index + 1
+
+
+def unescape(value: str) -> str:
+    """Resolve KConfig escapes (\\\\, \\s, \\t, \\n, \\r) in a raw value; others are kept."""
+    return ESCAPE_RE.sub(lambda m: UNESCAPES.get(m.group(1), m.group(0)), value)
+
+
+def escape(value: str) -> str:
+    """Escape a value so that KConfig reads it back unchanged."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace("\t", "\\t").replace("\r", "\\r")
+
+
+def edits_cleanly(content: str) -> bool:
+    """Whether adding a key to every group keeps all other keys intact, also
+    with the final newline removed."""
+    for text in (content, content.rstrip("\r\n")):
+        config = KConfig(text)
+        expected = {group: dict(keys) for group, keys in config.groups.items()}
+        for group in list(config._group_ends):
+            config.set(group, "MiesCheckProbe", "1")
+            expected[group]["MiesCheckProbe"] = "1"
+        if KConfig(str(config)).groups != expected:
+            return False
+    return True
+
+
+def parse_kconfig(content: str) -> KConfig:
+    return KConfig(content)
+
+
+def load_kconfig(path: Path) -> Optional[KConfig]:
+    """Shared, cached parse of a config file (None if it does not exist).
+    Do not modify it; parse the file again to edit it."""
+    return cached_parse(path, parse_kconfig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the groups and keys of KDE config files as JSON.")
+    parser.add_argument("files", type=Path, nargs="+", help="Config files")
+    parser.add_argument("--check", action="store_true",
+                        help="Only verify that every file serializes back byte-identically "
+                             "and that adding keys keeps it intact")
+    args = parser.parse_args()
+
+    failed = 0
+    for path in args.files:
+        content = path.read_bytes().decode("utf-8")
+        config = KConfig(content)
+        if args.check:
+            ok = str(config).encode("utf-8") == path.read_bytes() and edits_cleanly(content)
+            failed += not ok
+            print(f"  {'✓' if ok else '✗'} {path}")
+        else:
+            groups = {"][".join(group): keys for group, keys in config.groups.items() if group or keys}
+            print(json.dumps({str(path): groups}, indent=1))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""
+Generator and offline matcher for the KWin window rules in kwinruleset/.
+`generate` turns a compact app list into opacity rules: apps with the same
+opacity share one rule, duplicates and apps already covered by a regex of the
+same rule are dropped, and apps claimed by rules with different opacities are
+reported. `match` indexes rulesets (exact names in a dict, substrings, and
+the regexes behind one combined pre-filter) and answers which rules apply to
+each of a batch of WM_CLASS values.
+
+Matching follows KWin's Rules::matchWMClass: wmclassmatch 0 matches
+everything, 1 is a case-insensitive exact match, 2 a case-insensitive
+substring and 3 an unanchored, case-sensitive regex search, so a `^Firefox$`
+regex does not match the class `firefox` (`match` reports such rules as
+matching only when case is ignored). With wmclasscomplete=true the
+rule sees "name class", otherwise only the class. Values are KConfig-escaped
+in the files, so regex backslashes are written doubled. KWin uses PCRE; the
+patterns generated here are valid in both.
+"""
+
+import argparse
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+
+from mies.kconfig import KConfig, escape, load_kconfig, unescape
+from mies.paths import REPO_ROOT
+
+RULESET_DIR = REPO_ROOT / "kwinruleset"
+
+UNIMPORTANT, EXACT, SUBSTRING, REGEX = range(4)
+FORCE = "2"
+
+REGEX_PREFIX = "re:"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One [group] of a .kwinrule file."""
+
+    name: str
+    source: Path
+    wmclass: str
+    match: int
+    complete: bool
+    settings: Mapping[str, str]
+
+    @property
+    def forced(self) -> dict:
+        """Properties the rule forces, e.g. {"opacityactive": "100"}."""
+        forced = {}
+        for key, value in self.settings.items():
+            if key.endswith("rule") and value == FORCE:
+                forced[key[:-4]] = self.settings.get(key[:-4])
+        return forced
+
+
+def rules_in(config: KConfig, source: Path) -> list:
+    """Every rule of a parsed .kwinrule file, in file order."""
+    rules = []
+    for group, keys in config.groups.items():
+        if not group or not keys:
+            continue
+        try:
+            match = int(keys.get("wmclassmatch", UNIMPORTANT))
+        except ValueError:
+            print(f"Warning: Ignoring rule [{']['.join(group)}] in {source.name}: "
+                  f"bad wmclassmatch {keys['wmclassmatch']}")
+            continue
+        rules.append(Rule(
+            name=keys.get("Description", "][".join(group)),
+            source=source,
+            wmclass=unescape(keys.get("wmclass", "")),
+            match=match,
+            complete=keys.get("wmclasscomplete", "false") == "true",
+            settings=keys,
+        ))
+    return rules
+
+
+def load_rules(paths: Iterable[Path]) -> list:
+    rules = []
+    for path in paths:
+        config = load_kconfig(path)
+        if config is None:
+            print(f"Warning: Rule file not found: {path}")
+            continue
+        rules += rules_in(config, path)
+    return rules
+
+
+class RuleIndex:
+    """Answers which rules apply to a WM_CLASS, for many classes at once."""
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.always = []     # rule numbers matching every window
+        self.exact = {}      # (complete, lowercased wmclass) -> rule numbers
+        self.substrings = [] # (complete, lowercased needle, rule number)
+        self.regexes = []    # (complete, compiled pattern, rule number)
+        self.folded = []     # the same patterns compiled with re.IGNORECASE
+
+        for n, rule in enumerate(rules):
+            if rule.match == UNIMPORTANT:
+                self.always.append(n)
+            elif rule.match == EXACT:
+                self.exact.setdefault((rule.complete, rule.wmclass.lower()), []).append(n)
+            elif rule.match == SUBSTRING:
+                self.substrings.append((rule.complete, rule.wmclass.lower(), n))
+            elif rule.match == REGEX:
+                try:
+                    self.regexes.append((rule.complete, re.compile(rule.wmclass), n))
+                    self.folded.append((rule.complete, re.compile(rule.wmclass, re.IGNORECASE), n))
+                except re.error as e:
+                    print(f"Warning: Rule '{rule.name}' never matches, bad regex {rule.wmclass!r}: {e}")
+            else:
+                print(f"Warning: Rule '{rule.name}' has unknown wmclassmatch {rule.match}")
+
+        # One search tells whether any regex can match, so most classes skip the per-rule loop
+        self.prefilter = {}
+        for complete in (False, True):
+            patterns = [pattern.pattern for c, pattern, _ in self.regexes if c == complete]
+            if patterns:
+                try:
+                    self.prefilter[complete] = re.compile("|".join(f"(?:{p})" for p in patterns))
+                except re.error:
+                    pass  # backreferences by number do not survive being combined
+
+    def match(self, wmclass: str) -> list:
+        """Rules that apply to a window, in file order (KWin's precedence).
+        Pass "name class" to also match wmclasscomplete rules."""
+        name, _, cls = wmclass.rpartition(" ")
+        subjects = {False: cls, True: wmclass if name else None}
+        found = list(self.always)
+        for complete, subject in subjects.items():
+            if subject is None:
+                continue
+            lowered = subject.lower()
+            found += self.exact.get((complete, lowered), ())
+            found += [n for c, needle, n in self.substrings if c == complete and needle in lowered]
+            prefilter = self.prefilter.get(complete)
+            if prefilter is None or prefilter.search(subject):
+                found += [n for c, pattern, n in self.regexes if c == complete and pattern.search(subject)]
+        return [self.rules[n] for n in sorted(found)]
+
+    def case_misses(self, wmclass: str) -> list:
+        """Regex rules that only match the window if case is ignored, which KWin does not do."""
+        name, _, cls = wmclass.rpartition(" ")
+        subjects = {False: cls, True: wmclass if name else None}
+        found = []
+        for (complete, pattern, n), (_, folded, _) in zip(self.regexes, self.folded):
+            subject = subjects[complete]
+            if subject is not None and not pattern.search(subject) and folded.search(subject):
+                found.append(self.rules[n])
+        return found
+
+    def match_all(self, classes: Iterable[str]) -> dict:
+        """Rules per class; repeated classes are only matched once."""
+        results = {}
+        for wmclass in classes:
+            if wmclass not in results:
+                results[wmclass] = self.match(wmclass)
+        return results
+
+
+def conflicts(rules: list) -> dict:
+    """Properties forced to different values by the given rules (the first rule wins)."""
+    values = {}
+    for rule in rules:
+        for key, value in rule.forced.items():
+            values.setdefault(key, set()).add(value)
+    return {key: found for key, found in values.items() if len(found) > 1}
+
+
+# App list: one "<wmclass> <active opacity> [<inactive opacity>]" per line;
+# prefix a pattern with "re:" to match the class by regex.
+
+def parse_app_list(content: str) -> dict:
+    """(active, inactive) opacities per pattern, without duplicates."""
+    apps = {}
+    seen = {}  # lowercased exact names -> the spelling used first
+    for number, line in enumerate(content.splitlines(), 1):
+        text = line.split("#", 1)[0].strip()
+        if not text:
+            continue
+        fields = text.split()
+        try:
+            active = int(fields[1])
+            inactive = int(fields[2]) if len(fields) > 2 else active
+        except (IndexError, ValueError):
+            print(f"Warning: Skipping app list line {number}: {line.strip()}")
+            continue
+
+        pattern = fields[0]
+        if not pattern.startswith(REGEX_PREFIX):
+            pattern = seen.setdefault(pattern.lower(), pattern)
+        if pattern in apps and apps[pattern] != (active, inactive):
+            print(f"Warning: {pattern} is listed with {apps[pattern]} and {(active, inactive)}; "
+                  f"keeping the first")
+            continue
+        apps.setdefault(pattern, (active, inactive))
+    return apps
+
+
+def _covers(regex: str, name: str) -> bool:
+    return re.search(regex, name) is not None
+
+
+def group_apps(apps: dict) -> dict:
+    """Exact names and regexes per (active, inactive), without names a regex of
+    the same group already covers. Overlaps between groups are reported."""
+    groups = {}
+    for pattern, opacity in apps.items():
+        names, regexes = groups.setdefault(opacity, (set(), set()))
+        if pattern.startswith(REGEX_PREFIX):
+            regexes.add(pattern[len(REGEX_PREFIX):])
+        else:
+            names.add(pattern)
+
+    for opacity, (names, regexes) in groups.items():
+        for regex in regexes:
+            names -= {name for name in names if _covers(regex, name)}
+        for other, (other_names, _) in groups.items():
+            if other == opacity:
+                continue
+            for name in sorted(other_names):
+                if any(_covers(regex, name) for regex in regexes):
+                    print(f"Warning: {name} {other} also matches a regex of the {opacity} rule")
+    return groups
+
+
+def rule_for(names: set, regexes: set) -> tuple:
+    """(wmclass, wmclassmatch) matching any of the names (case-insensitively) or regexes."""
+    if len(names) == 1 and not regexes:
+        return next(iter(names)), EXACT
+    alternatives = sorted(regexes)
+    if names:
+        alternatives.insert(0, "(?i:^(?:" + "|".join(re.escape(name) for name in sorted(names)) + ")$)")
+    if len(alternatives) == 1:
+        return alternatives[0], REGEX
+    return "|".join(f"(?:{alternative})" for alternative in alternatives), REGEX
+
+
+def generate(apps: dict) -> KConfig:
+    """A ruleset with one forced-opacity rule per distinct (active, inactive)."""
+    config = KConfig()
+    for (active, inactive), (names, regexes) in sorted(group_apps(apps).items()):
+        if not names and not regexes:
+            continue
+        group = f"Opacity {active}-{inactive}"
+        wmclass, match = rule_for(names, regexes)
+        count = len(names) + len(regexes)
+        config.set(group, "Description", f"Opacity {active}/{inactive} ({count} app{'s' if count > 1 else ''})")
+        config.set(group, "opacityactive", str(active))
+        config.set(group, "opacityactiverule", FORCE)
+        config.set(group, "opacityinactive", str(inactive))
+        config.set(group, "opacityinactiverule", FORCE)
+        config.set(group, "wmclass", escape(wmclass))
+        config.set(group, "wmclasscomplete", "false")
+        config.set(group, "wmclassmatch", str(match))
+    return config
+
+
+def read_lines(path: Optional[Path]) -> list:
+    text = sys.stdin.read() if path is None or str(path) == "-" else path.read_text()
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and check KWin window rules.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="Build an opacity ruleset from an app list")
+    gen.add_argument("apps", type=Path, help="Lines of '<wmclass|re:regex> <active> [<inactive>]'")
+    gen.add_argument("-o", "--output", type=Path, help="Write the ruleset here instead of stdout")
+
+    match = commands.add_parser("match", help="Show which rules apply to WM_CLASS values")
+    match.add_argument("classes", type=Path, nargs="?",
+                       help="One class (or 'name class') per line; stdin if omitted")
+    match.add_argument("-r", "--rules", type=Path, action="append",
+                       help="Rule file (default: every kwinruleset/*.kwinrule)")
+    match.add_argument("-q", "--quiet", action="store_true", help="Only print conflicts and the summary")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        config = generate(parse_app_list(args.apps.read_text()))
+        if args.output:
+            config.write(args.output)
+            print(f"Wrote {len(config.groups) - 1} rules to {args.output}")
+        else:
+            print(config, end="")
+        return 0
+
+    index = RuleIndex(load_rules(args.rules or sorted(RULESET_DIR.glob("*.kwinrule"))))
+    classes = read_lines(args.classes)
+    start = time.perf_counter()
+    results = index.match_all(classes)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    conflicted = case_only = 0
+    for wmclass, rules in results.items():
+        clashes = conflicts(rules)
+        misses = index.case_misses(wmclass)
+        conflicted += bool(clashes)
+        case_only += bool(misses)
+        if clashes or misses or not args.quiet:
+            print(f"  {'!' if clashes else ' '} {wmclass}: {', '.join(rule.name for rule in rules) or '-'}")
+        for key, values in sorted(clashes.items()):
+            print(f"      {key} forced to {', '.join(sorted(values))}")
+        for rule in misses:
+            print(f"      '{rule.name}' would match ignoring case; KWin regexes are case-sensitive")
+    print(f"{len(results)} classes against {len(index.rules)} rules in {elapsed:.1f} ms, "
+          f"{sum(bool(rules) for rules in results.values())} matched, {conflicted} with conflicts, "
+          f"{case_only} missed only by case")
+    return 1 if conflicted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
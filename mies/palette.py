@@ -0,0 +1,124 @@
+"""
+Native palette compiler for the KDE color schemes.
+Replaces the `sed -f Installer/Pallets/<Flavor>.sed` pipeline: the template is
+tokenized once and every flavor x accent is rendered from the compiled form,
+producing output byte-identical to install.sh + Installer/color-build.sh.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from mies.palette_index import open_index
+from mies.paths import FLAVORS, REPO_ROOT, RESOURCES_DIR
+
+BASE_COLORS_FILE = RESOURCES_DIR / "Base.colors"
+
+# Same order as the accent menu in install.sh
+ACCENTS = ("Rosewater", "Flamingo", "Pink", "Mauve", "Red", "Maroon", "Peach",
+           "Yellow", "Green", "Teal", "Sky", "Sapphire", "Blue", "Lavender")
+
+# Placeholders install.sh substitutes before the palette pass
+METADATA_PLACEHOLDERS = ("--accentColor", "--flavour", "--accentName")
+
+
+def load_palette(flavor: str) -> dict:
+    """Load the "r, g, b" palette of a flavor from the palette index."""
+    index = open_index()
+    return {name: index.rgb_string(flavor, name) for name in index.names}
+
+
+def accent_color(palette: Mapping[str, str], accent: str) -> str:
+    """Accent color in the "r,g,b" spelling install.sh uses."""
+    return palette[accent.lower()].replace(" ", "")
+
+
+class CompiledTemplate:
+    """A template split once into literal text and placeholder segments."""
+
+    def __init__(self, content: str, tokens: Iterable[str]):
+        # Longest tokens first so the alternation never stops at a shorter prefix
+        ordered = sorted(set(tokens), key=len, reverse=True)
+        pattern = re.compile("|".join(re.escape(token) for token in ordered))
+
+        self.segments = []
+        pos = 0
+        for match in pattern.finditer(content):
+            if match.start() > pos:
+                self.segments.append((False, content[pos:match.start()]))
+            self.segments.append((True, match.group()))
+            pos = match.end()
+        if pos < len(content):
+            self.segments.append((False, content[pos:]))
+        self.placeholders = frozenset(text for bound, text in self.segments if bound)
+
+    def missing(self, bindings: Mapping[str, str]) -> set:
+        """Placeholders of the template the bindings leave unbound."""
+        return set(self.placeholders - bindings.keys())
+
+    def render(self, bindings: Mapping[str, str]) -> str:
+        return "".join(bindings[text] if bound else text for bound, text in self.segments)
+
+
+def palette_tokens() -> list:
+    """Placeholders of the palette pass, including the install.sh metadata ones."""
+    names = load_palette(FLAVORS[0]).keys()
+    return list(METADATA_PLACEHOLDERS) + [f"${name}" for name in names]
+
+
+def compile_file(source: Path, extra_tokens: Iterable[str] = ()) -> CompiledTemplate:
+    """Compile a template against the palette placeholders."""
+    content = source.read_bytes().decode("utf-8")
+    return CompiledTemplate(content, palette_tokens() + list(extra_tokens))
+
+
+def bindings_for(flavor: str, accent: str) -> dict:
+    """Every placeholder value for a flavor/accent combination."""
+    palette = load_palette(flavor)
+    bindings = {f"${name}": value for name, value in palette.items()}
+    bindings["--accentColor"] = accent_color(palette, accent)
+    bindings["--flavour"] = flavor
+    bindings["--accentName"] = accent
+    return bindings
+
+
+def scheme_name(flavor: str, accent: str) -> str:
+    return f"Catppuccin{flavor}{accent}.colors"
+
+
+def build_matrix(out_dir: Path, flavors: Iterable[str] = FLAVORS,
+                 accents: Iterable[str] = ACCENTS, source: Path = BASE_COLORS_FILE) -> list:
+    """Render every flavor x accent color scheme into out_dir."""
+    template = compile_file(source)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for flavor in flavors:
+        for accent in accents:
+            out = out_dir / scheme_name(flavor, accent)
+            out.write_bytes(template.render(bindings_for(flavor, accent)).encode("utf-8"))
+            written.append(out)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile Catppuccin color schemes.")
+    parser.add_argument("-o", "--output", type=Path, default=REPO_ROOT / "dist",
+                        help="Output directory")
+    parser.add_argument("-s", "--source", type=Path, default=BASE_COLORS_FILE,
+                        help="Source file")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append",
+                        help="Flavour name (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append",
+                        help="Accent name (default: all)")
+    args = parser.parse_args()
+
+    written = build_matrix(args.output, args.flavour or FLAVORS, args.accent or ACCENTS, args.source)
+    print(f"Wrote {len(written)} color schemes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Precomputed binary palette index.
+The Installer/Pallets/*.sed files are the canonical palette; they are compiled
+into a small fixed-layout file holding packed RGB, hex, HSL and linear RGB for
+every flavor x color name. Tools mmap the index read-only and read records in
+place, so nothing re-parses the palette text at startup.
+"""
+
+import argparse
+import colorsys
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from mies.paths import FLAVORS, PALETTE_DIR, REPO_ROOT, RESOURCES_DIR
+
+INDEX_FILE = RESOURCES_DIR / "palette.idx"
+MARKDOWN_FILE = REPO_ROOT / "PALETTE.md"
+
+# Order of the names in the index and in PALETTE.md
+COLOR_NAMES = ("rosewater", "flamingo", "pink", "mauve", "red", "maroon", "peach",
+               "yellow", "green", "teal", "sky", "sapphire", "blue", "lavender",
+               "text", "subtext1", "subtext0", "overlay2", "overlay1", "overlay0",
+               "surface2", "surface1", "surface0", "base", "mantle", "crust")
+MARKDOWN_FLAVORS = ("Latte", "Frappe", "Macchiato", "Mocha")
+
+MAGIC = b"MIESPAL1"
+HEADER = struct.Struct("<8sHHI")  # magic, flavor count, name count, records offset
+LABEL = struct.Struct("<16s")
+# packed 0xRRGGBB, "#rrggbb\0", HSL (degrees, 0-1, 0-1), linear RGB
+RECORD = struct.Struct("<I8s3f3f")
+
+SED_RULE_RE = re.compile(r'^s/\$(\w+)/([^/]*)/g$', re.MULTILINE)
+
+
+def parse_sed(content: str) -> dict:
+    """Parse a palette .sed file into {name: "r, g, b"}."""
+    return dict(SED_RULE_RE.findall(content))
+
+
+def _linear(channel: int) -> float:
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _record(rgb: tuple) -> bytes:
+    r, g, b = rgb
+    h, l, s = colorsys.rgb_to_hls(r / 255, g / 255, b / 255)
+    return RECORD.pack((r << 16) | (g << 8) | b, f"#{r:02x}{g:02x}{b:02x}".encode(),
+                       h * 360, s, l, _linear(r), _linear(g), _linear(b))
+
+
+def sources() -> list:
+    return [PALETTE_DIR / f"{flavor}.sed" for flavor in FLAVORS]
+
+
+def build_index(path: Path = INDEX_FILE) -> Path:
+    """Compile the .sed palettes into the binary index."""
+    records = []
+    for source in sources():
+        palette = parse_sed(source.read_text())
+        missing = set(COLOR_NAMES) - palette.keys()
+        if missing:
+            raise ValueError(f"{source} is missing {', '.join(sorted(missing))}")
+        for name in COLOR_NAMES:
+            records.append(_record(tuple(int(part) for part in palette[name].split(","))))
+
+    offset = HEADER.size + LABEL.size * (len(FLAVORS) + len(COLOR_NAMES))
+    data = [HEADER.pack(MAGIC, len(FLAVORS), len(COLOR_NAMES), offset)]
+    data += [LABEL.pack(label.encode()) for label in (*FLAVORS, *COLOR_NAMES)]
+    data += records
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(b"".join(data))
+    os.replace(tmp, path)
+    return path
+
+
+class PaletteIndex:
+    """Read-only view of a palette index file."""
+
+    def __init__(self, path: Path = INDEX_FILE):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n_flavors, n_names, self._records = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a palette index: {path}")
+        labels = [LABEL.unpack_from(self._map, HEADER.size + LABEL.size * i)[0].rstrip(b"\0").decode()
+                  for i in range(n_flavors + n_names)]
+        self.flavors = tuple(labels[:n_flavors])
+        self.names = tuple(labels[n_flavors:])
+        self._flavor_pos = {flavor: i for i, flavor in enumerate(self.flavors)}
+        self._name_pos = {name: i for i, name in enumerate(self.names)}
+
+    def _offset(self, flavor: str, name: str) -> int:
+        return self._records + RECORD.size * (self._flavor_pos[flavor] * len(self.names) + self._name_pos[name])
+
+    def record(self, flavor: str, name: str) -> tuple:
+        return RECORD.unpack_from(self._map, self._offset(flavor, name))
+
+    def rgb(self, flavor: str, name: str) -> tuple:
+        packed = struct.unpack_from("<I", self._map, self._offset(flavor, name))[0]
+        return packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF
+
+    def hex(self, flavor: str, name: str) -> str:
+        offset = self._offset(flavor, name) + 4
+        return self._map[offset:offset + 7].decode()
+
+    def hsl(self, flavor: str, name: str) -> tuple:
+        return struct.unpack_from("<3f", self._map, self._offset(flavor, name) + 12)
+
+    def linear(self, flavor: str, name: str) -> tuple:
+        return struct.unpack_from("<3f", self._map, self._offset(flavor, name) + 24)
+
+    def rgb_string(self, flavor: str, name: str) -> str:
+        """The "r, g, b" spelling of the .sed palettes."""
+        return "%d, %d, %d" % self.rgb(flavor, name)
+
+    def flavor_hex(self, flavor: str) -> dict:
+        return {name: self.hex(flavor, name) for name in self.names}
+
+    def close(self):
+        self._map.close()
+
+
+_index = None
+_index_lock = threading.Lock()  # the preview preloads themes on worker threads
+
+
+def is_stale(path: Path = INDEX_FILE) -> bool:
+    try:
+        built = path.stat().st_mtime_ns
+    except OSError:
+        return True
+    return any(source.stat().st_mtime_ns > built for source in sources())
+
+
+def open_index() -> PaletteIndex:
+    """The shared index of this repository, rebuilt first if the palettes changed."""
+    global _index
+    with _index_lock:
+        if is_stale():
+            build_index()
+            _index = None
+        if _index is None:
+            _index = PaletteIndex()
+        return _index
+
+
+def render_markdown(index: PaletteIndex) -> str:
+    """Render PALETTE.md from the index."""
+    lines = ["# Catppuccin Color Palette", ""]
+    for flavor in MARKDOWN_FLAVORS:
+        lines += [f"## {flavor}", "| Name       | Hex      | Preview |", "|------------|----------|----------|"]
+        for name in index.names:
+            hex_color = index.hex(flavor, name)
+            lines.append(f"| {name.capitalize():<10} | {hex_color}  | <span style=\"display:inline-block;"
+                         f"width:2em;height:1em;background:{hex_color}80;\"></span> |")
+        lines.append("")
+    lines.append("Source: https://github.com/catppuccin/catppuccin")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the palette index.")
+    parser.add_argument("-o", "--output", type=Path, default=INDEX_FILE, help="Index file")
+    parser.add_argument("--markdown", action="store_true", help="Also regenerate PALETTE.md")
+    args = parser.parse_args()
+
+    build_index(args.output)
+    print(f"Wrote {args.output}")
+    if args.markdown:
+        MARKDOWN_FILE.write_text(render_markdown(PaletteIndex(args.output)))
+        print(f"Wrote {MARKDOWN_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
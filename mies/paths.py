@@ -0,0 +1,12 @@
+"""Locations and names shared by every tool in this repository."""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESOURCES_DIR = REPO_ROOT / "Resources"
+AURORAE_DIR = RESOURCES_DIR / "Aurorae"
+COMMON_DIR = AURORAE_DIR / "Common"
+PALETTE_DIR = REPO_ROOT / "Installer" / "Pallets"
+
+FLAVORS = ("Mocha", "Macchiato", "Frappe", "Latte")
+STYLES = ("Modern", "Classic")
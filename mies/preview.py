@@ -0,0 +1,694 @@
+"""
+Qt widgets of the theme preview tool.
+The title bar, its buttons and the preview window all read their values from
+the theme files through mies.theme.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+try:
+    from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, 
+                                  QHBoxLayout, QLabel, QComboBox,
+                                  QFrame, QGraphicsDropShadowEffect)
+    from PyQt6.QtCore import Qt, QPoint, QRectF, QFileSystemWatcher, QTimer, QEvent, QObject, pyqtSignal
+    from PyQt6.QtGui import QColor, QPainter, QPixmap
+    from PyQt6.QtSvg import QSvgRenderer
+    PYQT6 = True
+except ImportError:
+    try:
+        from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout,
+                                      QHBoxLayout, QLabel, QComboBox,
+                                      QFrame, QGraphicsDropShadowEffect)
+        from PyQt5.QtCore import Qt, QPoint, QRectF, QFileSystemWatcher, QTimer, QEvent, QObject, pyqtSignal
+        from PyQt5.QtGui import QColor, QPainter, QPixmap
+        from PyQt5.QtSvg import QSvgRenderer
+        PYQT6 = False
+    except ImportError:
+        print("Error: PyQt5 or PyQt6 is required.")
+        print("")
+        print("On Arch Linux:")
+        print("    sudo pacman -S python-pyqt6 python-pyqt6-svg")
+        print("")
+        print("On other distros:")
+        print("    pip install PyQt6")
+        sys.exit(1)
+
+from mies.paths import FLAVORS, REPO_ROOT, STYLES
+from mies.theme import BUTTONS, Theme, ThemeConfig, load_theme, palette_hex, theme_changes
+from mies.trace import span, traced
+
+
+PIXMAP_CACHE_SIZE = 96
+PRELOAD_THREADS = 4
+
+
+def set_style_sheet(widget: QWidget, css: str):
+    """Apply a style sheet unless the widget already has it; re-polishing is costly."""
+    if widget.styleSheet() == css:
+        return
+    with span("setStyleSheet", widget=type(widget).__name__, size=len(css)):
+        widget.setStyleSheet(css)
+
+
+# (flavor, style) -> (theme, style sheets)
+_style_bundles = {}
+
+
+def style_bundle(theme: Theme) -> Mapping[str, str]:
+    """Every style sheet of the preview for a theme, built once per loaded theme."""
+    key = (theme.flavor, theme.style)
+    hit = _style_bundles.get(key)
+    if hit is not None and hit[0] == theme:
+        return hit[1]
+    
+    cfg = theme.config
+    base = palette_hex(theme.flavor)
+    inactive = theme.get_inactive_color()
+    path_color = theme.get_button_color("maximize" if theme.exists() else "close")
+    
+    bundle = {
+        "title": f"color: {cfg.active_text_color}; font-weight: bold; font-size: 13px;",
+        "title_bar": f"background-color: {base['mantle']}80;",
+        "container": f"""
+            QFrame {{
+                background-color: {base['base']}80;
+                border: 2px solid {base['surface0']}80;
+                border-radius: 12px;
+            }}
+        """,
+        # Text colors from rc file
+        "text": f"color: {cfg.active_text_color};",
+        "sub": f"color: {cfg.inactive_text_color}; font-size: 11px;",
+        "combo": f"""
+            QComboBox {{
+                background-color: {base['surface0']};
+                color: {cfg.active_text_color};
+                border: 1px solid {inactive};
+                border-radius: 4px;
+                padding: 5px 10px;
+            }}
+            QComboBox:hover {{ border-color: {theme.get_button_color('alldesktops')}; }}
+            QComboBox::drop-down {{ border: none; }}
+            QComboBox QAbstractItemView {{
+                background-color: {base['surface0']};
+                color: {cfg.active_text_color};
+                selection-background-color: {inactive};
+            }}
+        """,
+        "swatch_name": f"color: {cfg.inactive_text_color}; font-size: 11px;",
+        "swatch_value": f"color: {cfg.inactive_text_color}; font-size: 9px;",
+        "path_info": f"color: {path_color}; font-size: 10px;",
+    }
+    for name in BUTTONS:
+        color = theme.get_button_color(name)
+        bundle[f"swatch:{name}"] = f"background-color: {color}; border: none; border-radius: 2px;"
+    
+    bundle = MappingProxyType(bundle)
+    _style_bundles[key] = (theme, bundle)
+    return bundle
+
+
+class ButtonPixmapCache:
+    """LRU cache of button state groups rasterized from the real button SVGs."""
+    
+    def __init__(self, max_size: int = PIXMAP_CACHE_SIZE):
+        self.max_size = max_size
+        self.pixmaps = OrderedDict()
+        self.renderers = {}
+    
+    def renderer(self, svg_path: Path) -> QSvgRenderer:
+        renderer = self.renderers.get(svg_path)
+        if renderer is None:
+            renderer = self.renderers[svg_path] = QSvgRenderer(str(svg_path))
+        return renderer
+    
+    def get(self, svg_path: Path, state: str, width: int, height: int, dpr: float):
+        """Pixmap of one `<g id="{state}">` group, or None if the SVG has no such group."""
+        key = (svg_path, state, width, height, dpr)
+        if key in self.pixmaps:
+            self.pixmaps.move_to_end(key)
+            return self.pixmaps[key]
+        
+        renderer = self.renderer(svg_path)
+        pixmap = None
+        if renderer.isValid() and renderer.elementExists(state):
+            pixmap = QPixmap(round(width * dpr), round(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent if PYQT6 else Qt.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter, state, QRectF(0, 0, width, height))
+            painter.end()
+        
+        self.pixmaps[key] = pixmap
+        while len(self.pixmaps) > self.max_size:
+            evicted = self.pixmaps.popitem(last=False)[0][0]
+            if not any(key[0] == evicted for key in self.pixmaps):
+                self.renderers.pop(evicted, None)
+        return pixmap
+    
+    def discard(self, svg_path: Path):
+        """Drop everything rendered from an SVG, e.g. after it was edited."""
+        self.renderers.pop(svg_path, None)
+        for key in [key for key in self.pixmaps if key[0] == svg_path]:
+            del self.pixmaps[key]
+
+
+PIXMAPS = ButtonPixmapCache()
+
+
+class ThemePreloader(QObject):
+    """Loads themes on worker threads and hands each one to the GUI thread via
+    `loaded`, together with the generation it was queued in."""
+    
+    loaded = pyqtSignal(int, object)
+    
+    def __init__(self, parent=None, threads: int = PRELOAD_THREADS):
+        super().__init__(parent)
+        self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="mies-preload")
+        self.generation = 0
+        self.pending = []
+    
+    def preload(self, combos):
+        """Queue (flavor, style) pairs; they are loaded in the given order."""
+        self.pending = [future for future in self.pending if not future.done()]
+        for flavor, style in combos:
+            future = self.pool.submit(load_theme, flavor, style)
+            future.add_done_callback(partial(self._done, self.generation))
+            self.pending.append(future)
+    
+    def reset(self):
+        """Cancel queued loads; themes still loading arrive with an old generation."""
+        self.generation += 1
+        for future in self.pending:
+            future.cancel()
+        self.pending = []
+    
+    def _done(self, generation: int, future):
+        # Runs on the worker thread; the queued signal delivers the theme on the GUI thread
+        if future.cancelled():
+            return
+        if future.exception():
+            print(f"Warning: Could not preload theme: {future.exception()}")
+            return
+        self.loaded.emit(generation, future.result())
+    
+    def shutdown(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+class TitleBarButton(QWidget):
+    """Title bar button - dimensions loaded from rc file, art from its SVG."""
+    
+    def __init__(self, svg_path: Path, color: str, width: int, height: int, action=None, parent=None):
+        super().__init__(parent)
+        self.svg_path = svg_path
+        self.color = color
+        self.btn_width = width
+        self.btn_height = height
+        self.action = action
+        self.hovered = False
+        self.pressed = False
+        
+        self.setFixedSize(width, height)
+        self.setCursor(Qt.CursorShape.PointingHandCursor if PYQT6 else Qt.PointingHandCursor)
+    
+    def set_svg(self, svg_path: Path, color: str):
+        self.svg_path = svg_path
+        self.color = color
+        self.update()
+    
+    def set_color(self, color: str):
+        self.color = color
+        self.update()
+    
+    def set_size(self, width: int, height: int):
+        self.btn_width = width
+        self.btn_height = height
+        self.setFixedSize(width, height)
+        self.update()
+    
+    def state(self) -> str:
+        """Id of the SVG group for the current state, as Aurorae names them."""
+        if not self.isActiveWindow():
+            return "hover-inactive-center" if self.hovered else "inactive-center"
+        if self.pressed:
+            return "pressed-center"
+        return "hover-center" if self.hovered else "active-center"
+    
+    @traced()
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        pixmap = PIXMAPS.get(self.svg_path, self.state(), self.btn_width, self.btn_height,
+                             self.devicePixelRatioF())
+        if pixmap is not None:
+            painter.drawPixmap(0, 0, pixmap)
+            painter.end()
+            return
+        
+        # No state group in the SVG: plain rounded rectangle (matching SVG rx=2)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing if PYQT6 else QPainter.Antialiasing)
+        c = QColor(self.color)
+        if self.pressed:
+            c.setAlphaF(0.6)
+        elif self.hovered:
+            c.setAlphaF(0.85)
+        painter.setBrush(c)
+        painter.setPen(Qt.PenStyle.NoPen if PYQT6 else Qt.NoPen)
+        painter.drawRoundedRect(0, 0, self.btn_width, self.btn_height, 2, 2)
+        painter.end()
+    
+    def changeEvent(self, event):
+        if event.type() == (QEvent.Type.ActivationChange if PYQT6 else QEvent.ActivationChange):
+            self.update()
+        super().changeEvent(event)
+    
+    def enterEvent(self, event):
+        self.hovered = True
+        self.update()
+    
+    def leaveEvent(self, event):
+        self.hovered = False
+        self.pressed = False
+        self.update()
+    
+    def mousePressEvent(self, event):
+        self.pressed = True
+        self.update()
+    
+    def mouseReleaseEvent(self, event):
+        self.pressed = False
+        self.update()
+        if self.action and self.rect().contains(event.pos()):
+            self.action()
+
+
+class CustomTitleBar(QWidget):
+    """Draggable title bar with buttons from real theme files."""
+    
+    def __init__(self, window, theme: Theme):
+        super().__init__(window)
+        self.window = window
+        self.theme = theme
+        self.drag_pos = None
+        self.setup_ui()
+    
+    def setup_ui(self):
+        cfg = self.theme.config
+        styles = style_bundle(self.theme)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(15, 8, 15, 8)
+        layout.setSpacing(0)
+        
+        self.title = QLabel(f"  Catppuccin {self.theme.flavor} - {self.theme.style}")
+        set_style_sheet(self.title, styles["title"])
+        layout.addWidget(self.title)
+        layout.addStretch()
+        
+        # Buttons with spacing from rc file
+        btn_box = QWidget()
+        btn_layout = QHBoxLayout(btn_box)
+        btn_layout.setContentsMargins(0, 0, 0, 0)
+        btn_layout.setSpacing(cfg.button_spacing)
+        
+        w, h = cfg.button_width, cfg.button_height
+        
+        self.btn_min = TitleBarButton(self.theme.button_file("minimize"), self.theme.get_button_color("minimize"),
+                                      w, h, self.window.showMinimized)
+        self.btn_max = TitleBarButton(self.theme.button_file("maximize"), self.theme.get_button_color("maximize"),
+                                      w, h, self.toggle_max)
+        self.btn_close = TitleBarButton(self.theme.button_file("close"), self.theme.get_button_color("close"),
+                                        w, h, self.window.close)
+        
+        btn_layout.addWidget(self.btn_min)
+        btn_layout.addWidget(self.btn_max)
+        btn_layout.addWidget(self.btn_close)
+        layout.addWidget(btn_box)
+        self.buttons = {"minimize": self.btn_min, "maximize": self.btn_max, "close": self.btn_close}
+        
+        set_style_sheet(self, styles["title_bar"])
+        self.setFixedHeight(40)
+    
+    def toggle_max(self):
+        if self.window.isMaximized():
+            self.window.showNormal()
+        else:
+            self.window.showMaximized()
+    
+    def update_theme(self, theme: Theme):
+        self.theme = theme
+        cfg = theme.config
+        styles = style_bundle(theme)
+        
+        self.title.setText(f"  Catppuccin {theme.flavor} - {theme.style}")
+        set_style_sheet(self.title, styles["title"])
+        set_style_sheet(self, styles["title_bar"])
+        
+        w, h = cfg.button_width, cfg.button_height
+        
+        self.btn_min.set_svg(theme.button_file("minimize"), theme.get_button_color("minimize"))
+        self.btn_min.set_size(w, h)
+        
+        self.btn_max.set_svg(theme.button_file("maximize"), theme.get_button_color("maximize"))
+        self.btn_max.set_size(w, h)
+        
+        self.btn_close.set_svg(theme.button_file("close"), theme.get_button_color("close"))
+        self.btn_close.set_size(w, h)
+        
+        # Update button spacing
+        btn_layout = self.btn_min.parent().layout()
+        if btn_layout:
+            btn_layout.setSpacing(cfg.button_spacing)
+    
+    def mousePressEvent(self, event):
+        if event.button() == (Qt.MouseButton.LeftButton if PYQT6 else Qt.LeftButton):
+            self.drag_pos = event.globalPosition().toPoint() if PYQT6 else event.globalPos()
+    
+    def mouseMoveEvent(self, event):
+        if self.drag_pos:
+            pos = event.globalPosition().toPoint() if PYQT6 else event.globalPos()
+            self.window.move(self.window.pos() + pos - self.drag_pos)
+            self.drag_pos = pos
+    
+    def mouseReleaseEvent(self, event):
+        self.drag_pos = None
+    
+    def mouseDoubleClickEvent(self, event):
+        self.toggle_max()
+
+
+class ThemeWindow(QWidget):
+    """Frameless window using REAL Catppuccin theme files from repository."""
+    
+    def __init__(self, watch: bool = False, preload: bool = True):
+        super().__init__()
+        self.flavor = "Mocha"
+        self.style = "Modern"
+        self.theme = load_theme(self.flavor, self.style)
+        # (flavor, style) -> Theme; filled by the preloader so switching needs no disk I/O
+        self.themes = {(self.flavor, self.style): self.theme}
+        
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint if PYQT6 else Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground if PYQT6 else Qt.WA_TranslucentBackground)
+        
+        self.setup_ui()
+        self.apply_theme()
+        
+        self.preloader = None
+        if preload:
+            self.preloader = ThemePreloader(self)
+            self.preloader.loaded.connect(self.on_theme_loaded)
+            self.preload_themes()
+        
+        self.watcher = None
+        if watch:
+            self.start_watching()
+    
+    def preload_themes(self):
+        """Load every other flavor/style in the background, current style first."""
+        styles = [self.style] + [style for style in STYLES if style != self.style]
+        combos = [(flavor, style) for style in styles for flavor in FLAVORS]
+        self.preloader.preload(combo for combo in combos if combo not in self.themes)
+    
+    def on_theme_loaded(self, generation: int, theme: Theme):
+        # Loads queued before a reload may have read the files before they changed
+        if generation != self.preloader.generation:
+            return
+        # Never replace a theme that was loaded (or reloaded) in the meantime
+        self.themes.setdefault((theme.flavor, theme.style), theme)
+    
+    def theme_for(self, flavor: str, style: str) -> Theme:
+        """The preloaded theme, or a synchronous load if it has not arrived yet."""
+        theme = self.themes.get((flavor, style))
+        if theme is None:
+            theme = self.themes[(flavor, style)] = load_theme(flavor, style)
+        return theme
+    
+    def closeEvent(self, event):
+        if self.preloader:
+            self.preloader.shutdown()
+        super().closeEvent(event)
+    
+    def setup_ui(self):
+        self.container = QFrame(self)
+        main = QVBoxLayout(self)
+        main.setContentsMargins(5, 5, 5, 5)
+        main.addWidget(self.container)
+        
+        layout = QVBoxLayout(self.container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Title bar
+        self.title_bar = CustomTitleBar(self, self.theme)
+        layout.addWidget(self.title_bar)
+        
+        # Content
+        content = QWidget()
+        c_layout = QVBoxLayout(content)
+        c_layout.setContentsMargins(25, 25, 25, 25)
+        c_layout.setSpacing(15)
+        
+        # Flavor selector
+        row = QWidget()
+        r_layout = QHBoxLayout(row)
+        r_layout.setContentsMargins(0, 0, 0, 0)
+        r_layout.setSpacing(10)
+        
+        self.lbl_flavor = QLabel("Flavor:")
+        r_layout.addWidget(self.lbl_flavor)
+        
+        self.combo_flavor = QComboBox()
+        self.combo_flavor.addItems(list(FLAVORS))
+        self.combo_flavor.currentTextChanged.connect(self.on_flavor_changed)
+        self.combo_flavor.setMinimumWidth(130)
+        r_layout.addWidget(self.combo_flavor)
+        
+        self.lbl_style = QLabel("Style:")
+        r_layout.addWidget(self.lbl_style)
+        
+        self.combo_style = QComboBox()
+        self.combo_style.addItems(list(STYLES))
+        self.combo_style.currentTextChanged.connect(self.on_style_changed)
+        r_layout.addWidget(self.combo_style)
+        
+        r_layout.addStretch()
+        c_layout.addWidget(row)
+        
+        # Info
+        self.info = QLabel()
+        self.info.setWordWrap(True)
+        c_layout.addWidget(self.info)
+        
+        # Config display
+        self.config_display = QLabel()
+        self.config_display.setWordWrap(True)
+        c_layout.addWidget(self.config_display)
+        
+        # Color preview
+        self.lbl_colors = QLabel("Button colors from SVG files:")
+        c_layout.addWidget(self.lbl_colors)
+        
+        swatches = QWidget()
+        sw_layout = QHBoxLayout(swatches)
+        sw_layout.setContentsMargins(0, 5, 0, 10)
+        sw_layout.setSpacing(25)
+        
+        self.swatch_close = self.make_swatch("Close")
+        self.swatch_max = self.make_swatch("Maximize")
+        self.swatch_min = self.make_swatch("Minimize")
+        sw_layout.addWidget(self.swatch_close)
+        sw_layout.addWidget(self.swatch_max)
+        sw_layout.addWidget(self.swatch_min)
+        self.swatches = {"close": self.swatch_close, "maximize": self.swatch_max, "minimize": self.swatch_min}
+        sw_layout.addStretch()
+        c_layout.addWidget(swatches)
+        
+        c_layout.addStretch()
+        
+        # Path info
+        self.path_info = QLabel()
+        self.path_info.setWordWrap(True)
+        c_layout.addWidget(self.path_info)
+        
+        layout.addWidget(content)
+        
+        self.setMinimumSize(600, 450)
+        self.resize(650, 500)
+    
+    def make_swatch(self, name: str) -> QWidget:
+        w = QWidget()
+        l = QVBoxLayout(w)
+        l.setContentsMargins(0, 0, 0, 0)
+        l.setSpacing(4)
+        
+        rect = QFrame()
+        fallback = ThemeConfig()  # resized from the theme's rc values in apply_swatch
+        rect.setFixedSize(fallback.button_width, fallback.button_height)
+        set_style_sheet(rect, "border-radius: 2px;")
+        l.addWidget(rect, alignment=Qt.AlignmentFlag.AlignCenter if PYQT6 else Qt.AlignCenter)
+        
+        lbl = QLabel(name)
+        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter if PYQT6 else Qt.AlignCenter)
+        l.addWidget(lbl)
+        
+        color_lbl = QLabel()
+        color_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter if PYQT6 else Qt.AlignCenter)
+        l.addWidget(color_lbl)
+        
+        w.rect_frame = rect
+        w.name_lbl = lbl
+        w.color_lbl = color_lbl
+        return w
+    
+    @traced()
+    def on_flavor_changed(self, flavor: str):
+        self.flavor = flavor
+        self.theme = self.theme_for(flavor, self.style)
+        self.apply_theme()
+        self.watch_theme_files()
+    
+    @traced()
+    def on_style_changed(self, style: str):
+        self.style = style
+        self.theme = self.theme_for(self.flavor, style)
+        self.apply_theme()
+        self.watch_theme_files()
+    
+    def start_watching(self):
+        """Reload the theme whenever one of its files changes on disk (inotify on Linux)."""
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_theme_file_changed)
+        self.watcher.directoryChanged.connect(self.on_theme_file_changed)
+        
+        # Editors often write several events per save; reload once per burst
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(10)
+        self.reload_timer.timeout.connect(self.reload_theme)
+        
+        self.watch_theme_files()
+    
+    def watch_theme_files(self):
+        if not self.watcher:
+            return
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        
+        # Watch the directories too: editors that save by renaming replace
+        # the file, which drops it from the watch list.
+        paths = [self.theme.rc_file, self.theme.rc_file.parent, self.theme.theme_dir]
+        paths += [self.theme.button_file(button) for button in BUTTONS]
+        self.watcher.addPaths([str(p) for p in paths if p.exists()])
+    
+    def on_theme_file_changed(self, path: str):
+        self.reload_timer.start()
+    
+    @traced()
+    def reload_theme(self):
+        start = time.perf_counter()
+        old, self.theme = self.theme, load_theme(self.flavor, self.style)
+        changes = theme_changes(old, self.theme)
+        self.apply_changes(changes)
+        self.watch_theme_files()
+        
+        # The rc files are shared between flavors, so other preloaded themes may be stale too
+        if changes:
+            self.themes = {(self.flavor, self.style): self.theme}
+            if self.preloader:
+                self.preloader.reset()
+                self.preload_themes()
+        
+        if changes:
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"Reloaded {', '.join(sorted(changes))} in {elapsed:.1f} ms")
+    
+    def apply_changes(self, changes: set):
+        """Push only what changed to the affected widgets."""
+        for button_name in changes & set(BUTTONS):
+            PIXMAPS.discard(self.theme.button_file(button_name))
+        if "config" in changes:
+            self.apply_theme()
+            return
+        
+        self.title_bar.theme = self.theme
+        for button_name in changes & self.title_bar.buttons.keys():
+            self.title_bar.buttons[button_name].set_color(self.theme.get_button_color(button_name))
+        for button_name in changes & self.swatches.keys():
+            self.apply_swatch(button_name, self.swatches[button_name])
+        if changes & {"inactive", "alldesktops"}:
+            self.apply_combo_style()
+        if changes & {"maximize", "close"}:
+            self.apply_path_info()
+    
+    @traced()
+    def apply_theme(self):
+        self.title_bar.update_theme(self.theme)
+        
+        cfg = self.theme.config
+        styles = style_bundle(self.theme)
+        
+        # Widgets whose resolved CSS did not change are skipped by set_style_sheet
+        set_style_sheet(self.container, styles["container"])
+        set_style_sheet(self.lbl_flavor, styles["text"])
+        set_style_sheet(self.lbl_style, styles["text"])
+        set_style_sheet(self.lbl_colors, styles["text"])
+        
+        # Info text
+        set_style_sheet(self.info, styles["text"])
+        self.info.setText(
+            "This window uses REAL theme files from the repository!\n\n"
+            "• Button colors are read from SVG files\n"
+            "• Dimensions and spacing from rc config files\n"
+            "• Text colors from rc config files\n"
+            "• No hardcoded mock values!"
+        )
+        
+        # Config display
+        set_style_sheet(self.config_display, styles["sub"])
+        self.config_display.setText(
+            f"RC Config: ButtonWidth={cfg.button_width}, "
+            f"ButtonHeight={cfg.button_height}, "
+            f"ButtonSpacing={cfg.button_spacing}, "
+            f"TitleHeight={cfg.title_height}"
+        )
+        
+        self.apply_combo_style()
+        
+        # Swatches - show actual colors from SVG files
+        for button_name, sw in self.swatches.items():
+            self.apply_swatch(button_name, sw)
+        
+        self.apply_path_info()
+    
+    @traced()
+    def apply_combo_style(self):
+        combo_css = style_bundle(self.theme)["combo"]
+        set_style_sheet(self.combo_flavor, combo_css)
+        set_style_sheet(self.combo_style, combo_css)
+    
+    def apply_swatch(self, button_name: str, sw: QWidget):
+        cfg = self.theme.config
+        styles = style_bundle(self.theme)
+        set_style_sheet(sw.rect_frame, styles[f"swatch:{button_name}"])
+        sw.rect_frame.setFixedSize(cfg.button_width, cfg.button_height)
+        set_style_sheet(sw.name_lbl, styles["swatch_name"])
+        set_style_sheet(sw.color_lbl, styles["swatch_value"])
+        sw.color_lbl.setText(self.theme.get_button_color(button_name))
+    
+    def apply_path_info(self):
+        if self.theme.exists():
+            rc_rel = self.theme.rc_file.relative_to(REPO_ROOT)
+            theme_rel = self.theme.theme_dir.relative_to(REPO_ROOT)
+            self.path_info.setText(f"✓ RC: {rc_rel}\n✓ SVGs: {theme_rel}/")
+        else:
+            self.path_info.setText(f"✗ Theme not found: {self.theme.theme_dir}")
+        set_style_sheet(self.path_info, style_bundle(self.theme)["path_info"])
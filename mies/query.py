@@ -0,0 +1,203 @@
+"""
+Batch queries of resolved theme facts, without Qt.
+A query names a flavor, a style and optionally an accent. The answer is a
+JSON object with the button geometry and per-state colors, title colors,
+padding, layout, palette and accent color of that theme. Any number of
+queries is resolved in one call: the rc and SVG parses are shared through
+the parse cache, so repeated flavor/style combinations cost no re-parse, and
+large batches can fan out over a process pool. The CLI streams the answers
+as newline-delimited JSON, one line per query, in query order.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from typing import Iterable, Iterator, Optional
+
+from mies.palette import ACCENTS
+from mies.paths import FLAVORS, STYLES
+from mies.theme import Theme, load_theme, palette_hex
+
+# Queries sent to the pool at a time, so answers stream while stdin is still read
+BATCH_SIZE = 512
+
+
+class QueryError(ValueError):
+    """An input line that is not a query; read_queries yields it in the query's place."""
+
+    def __init__(self, message: str, line: str):
+        super().__init__(message)
+        self.line = line
+
+
+def _canonical(value: str, choices: tuple, what: str) -> str:
+    """The spelling of a flavor, style or accent used by the theme files."""
+    for choice in choices:
+        if choice.lower() == str(value).lower():
+            return choice
+    raise ValueError(f"Unknown {what} {value!r} (expected one of {', '.join(choices)})")
+
+
+def theme_facts(theme: Theme) -> dict:
+    """The resolved values of a loaded theme as a JSON-serializable dict."""
+    cfg = theme.config
+    return {
+        "theme": theme.theme_dir.name,
+        "flavor": theme.flavor,
+        "style": theme.style,
+        "button": {"width": cfg.button_width, "height": cfg.button_height, "spacing": cfg.button_spacing},
+        "title": {"height": cfg.title_height, "active_color": cfg.active_text_color,
+                  "inactive_color": cfg.inactive_text_color},
+        "padding": {"left": cfg.padding_left, "top": cfg.padding_top,
+                    "right": cfg.padding_right, "bottom": cfg.padding_bottom},
+        "layout": dict(cfg.layout),
+        "buttons": {name: {state: {"fill": s.fill, "opacity": s.opacity} for state, s in art.states.items()}
+                    for name, art in theme.buttons.items()},
+        "inactive_color": theme.inactive_color,
+    }
+
+
+def resolve(flavor: str, style: str, accent: Optional[str] = None) -> dict:
+    """Facts of one flavor/style, plus the accent color if an accent is given."""
+    flavor, style, accent = combination({"flavor": flavor, "style": style, "accent": accent})
+    facts = theme_facts(load_theme(flavor, style))
+    palette = palette_hex(flavor)
+    if accent is not None:
+        facts["accent"] = accent
+        facts["accent_color"] = palette[accent.lower()]
+    facts["palette"] = dict(palette)
+    return facts
+
+
+def parse_query(line: str) -> dict:
+    """A query from a JSON object or a "<flavour> <style> [<accent>]" line."""
+    line = line.strip()
+    if line.startswith("{"):
+        query = json.loads(line)
+        if not isinstance(query, dict):
+            raise ValueError("Query is not a JSON object")
+        return query
+    fields = line.split()
+    if len(fields) not in (2, 3):
+        raise ValueError(f"Expected '<flavour> <style> [<accent>]', got {line!r}")
+    return dict(zip(("flavor", "style", "accent"), fields))
+
+
+def combination(query: dict) -> tuple:
+    """The canonical (flavor, style, accent) a query asks for; ValueError if invalid."""
+    if isinstance(query, QueryError):
+        raise query
+    try:
+        flavor, style = query["flavor"], query["style"]
+    except KeyError as e:
+        raise ValueError(f"Missing {e}") from None
+    accent = query.get("accent")
+    return (_canonical(flavor, FLAVORS, "flavour"), _canonical(style, STYLES, "style"),
+            None if accent is None else _canonical(accent, ACCENTS, "accent"))
+
+
+def _resolve(key: tuple) -> dict:
+    return resolve(*key)
+
+
+def _quiet_worker():
+    # Theme loading warnings must not end up in the JSON stream
+    sys.stdout = sys.stderr
+
+
+def query(queries: Iterable[dict], workers: int = 1) -> Iterator[dict]:
+    """Answers to the queries, in order; invalid queries get {"query", "error"}
+    and QueryError items from read_queries {"line", "error"}.
+    Each distinct combination is resolved once per call and its answer shared
+    by every query asking for it, so answers must not be mutated. With more
+    than one worker, the new combinations of each batch go to a process pool."""
+    answers = {}
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker) if workers > 1 else None
+    try:
+        queries = iter(queries)
+        while True:
+            batch = list(itertools.islice(queries, BATCH_SIZE))
+            if not batch:
+                break
+            keys = []
+            for q in batch:
+                try:
+                    keys.append(combination(q))
+                except ValueError as e:
+                    keys.append(e)
+            new = [key for key in dict.fromkeys(k for k in keys if isinstance(k, tuple)) if key not in answers]
+            if pool is not None and len(new) > 1:
+                answers.update(zip(new, pool.map(_resolve, new, chunksize=max(1, len(new) // (workers * 4)))))
+            else:
+                answers.update((key, _resolve(key)) for key in new)
+
+            for q, key in zip(batch, keys):
+                if isinstance(key, tuple):
+                    yield answers[key]
+                elif isinstance(q, QueryError):
+                    yield {"line": q.line, "error": str(q)}
+                else:
+                    yield {"query": q, "error": str(key)}
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[dict]:
+    """Queries of an input stream; blank lines and # comments are skipped and
+    lines that are not queries become QueryError items."""
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        try:
+            yield parse_query(line)
+        except ValueError as e:
+            yield QueryError(str(e), line.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve theme facts as newline-delimited JSON.")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append", help="Window decoration style (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append", help="Accent (default: all)")
+    parser.add_argument("-i", "--input", metavar="FILE",
+                        help="Read queries ('<flavour> <style> [<accent>]' or JSON objects) per line; '-' for stdin")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes (default: 1, in-process)")
+    args = parser.parse_args()
+
+    if args.input and args.input != "-":
+        stream = open(args.input)
+    else:
+        stream = nullcontext(sys.stdin)
+
+    out = sys.stdout
+    start = time.perf_counter()
+    count = errors = 0
+    lines = {}  # id of a shared answer -> its JSON line
+    with stream as lines_in, redirect_stdout(sys.stderr):
+        if args.input:
+            queries = read_queries(lines_in)
+        else:
+            queries = ({"flavor": f, "style": s, "accent": a} for f, s, a in itertools.product(
+                args.flavour or FLAVORS, args.style or STYLES, args.accent or ACCENTS))
+        for result in query(queries, args.jobs):
+            count += 1
+            if "error" in result:
+                errors += 1
+                out.write(json.dumps(result, separators=(",", ":")) + "\n")
+                continue
+            line = lines.get(id(result))
+            if line is None:
+                line = lines[id(result)] = json.dumps(result, separators=(",", ":")) + "\n"
+            out.write(line)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{count} answers ({errors} errors) in {elapsed:.1f} ms", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Streaming SVG recoloring for the Aurorae decorations.
+Each style has one set of template SVGs under Resources/Aurorae/Templates/<Style>
+that reference palette colors as `$name` in fill, stroke and stop-color values.
+A template is fed through expat in chunks once and written to every flavor at
+the same time, so memory stays bounded and no flavor re-parses the template.
+"""
+
+import argparse
+import io
+import re
+import sys
+from pathlib import Path
+from typing import BinaryIO, Iterable, Mapping
+from xml.parsers import expat
+
+from mies.palette_index import open_index
+from mies.paths import AURORAE_DIR, FLAVORS, STYLES
+from mies.theme import theme_dir_for
+
+TEMPLATE_DIR = AURORAE_DIR / "Templates"
+CHUNK_SIZE = 16384
+
+# Colors the templates may use besides plain palette names
+ROLES = {"inactive": "surface1"}
+ROLE_OVERRIDES = {"Latte": {"inactive": "surface2"}}
+
+COLOR_ATTRS = ("fill", "stroke", "stop-color")
+TAG_ATTR_RE = re.compile(rb'(\s)(fill|stroke|stop-color|style)(\s*=\s*)(["\'])(.*?)\4', re.DOTALL)
+STYLE_DECL_RE = re.compile(rb'((?:^|;)\s*(?:fill|stroke|stop-color)\s*:\s*)\$([\w-]+)')
+VALUE_RE = re.compile(rb'^\s*\$([\w-]+)\s*$')
+
+
+def flavor_colors(flavor: str) -> dict:
+    """Every name a template may reference, resolved to hex for a flavor."""
+    colors = open_index().flavor_hex(flavor)
+    roles = dict(ROLES, **ROLE_OVERRIDES.get(flavor, {}))
+    for role, name in roles.items():
+        colors[role] = colors[name]
+    return colors
+
+
+def _lookup(colors: Mapping[str, bytes], name: bytes) -> bytes:
+    try:
+        return colors[name]
+    except KeyError:
+        raise KeyError(f"Unknown template color: ${name.decode()}") from None
+
+
+def recolor_tag(tag: bytes, colors: Mapping[bytes, bytes]) -> bytes:
+    """Resolve the `$name` colors of a single start tag."""
+    def attr(match):
+        name, value = match.group(2), match.group(5)
+        if name == b"style":
+            value = STYLE_DECL_RE.sub(lambda m: m.group(1) + _lookup(colors, m.group(2)), value)
+        else:
+            ref = VALUE_RE.match(value)
+            if ref:
+                value = _lookup(colors, ref.group(1))
+        return match.group(1) + name + match.group(3) + match.group(4) + value + match.group(4)
+
+    return TAG_ATTR_RE.sub(attr, tag)
+
+
+def _tag_end(buf: bytes, start: int) -> int:
+    """Index just past the '>' closing the tag that starts at buf[start]."""
+    quote = None
+    for i in range(start, len(buf)):
+        c = buf[i]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in b"\"'":
+            quote = c
+        elif c == 0x3E:  # '>'
+            return i + 1
+    raise ValueError("Unterminated tag")
+
+
+def recolor_stream(source: BinaryIO, outputs: Mapping[str, BinaryIO],
+                   colors: Mapping[str, Mapping[str, str]], chunk_size: int = CHUNK_SIZE):
+    """Stream one template into several outputs, one color table per output."""
+    tables = {key: {name.encode(): value.encode() for name, value in colors[key].items()}
+              for key in outputs}
+    buf = bytearray()
+    offset = 0   # absolute position of buf[0]
+    emitted = 0  # absolute position up to which every output is written
+
+    def write_all(data: bytes):
+        for out in outputs.values():
+            out.write(data)
+
+    def start_element(name, attrs):
+        nonlocal emitted
+        if not any(key in COLOR_ATTRS or key == "style" for key in attrs):
+            return
+        if not any("$" in attrs.get(key, "") for key in (*COLOR_ATTRS, "style")):
+            return
+
+        start = parser.CurrentByteIndex - offset
+        end = _tag_end(buf, start)
+        write_all(bytes(buf[emitted - offset:start]))
+        tag = bytes(buf[start:end])
+        for key, out in outputs.items():
+            out.write(recolor_tag(tag, tables[key]))
+        emitted = offset + end
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+
+    while True:
+        chunk = source.read(chunk_size)
+        buf += chunk
+        parser.Parse(chunk, not chunk)
+        if not chunk:
+            break
+
+        # A tag still being parsed starts at the last '<' ('<' is not allowed
+        # inside attribute values), so everything before it can be flushed.
+        safe = max(buf.rfind(b"<"), emitted - offset)
+        if safe > emitted - offset:
+            write_all(bytes(buf[emitted - offset:safe]))
+            emitted = offset + safe
+        del buf[:emitted - offset]
+        offset = emitted
+
+    write_all(bytes(buf[emitted - offset:]))
+
+
+def templates(style: str) -> list:
+    return sorted((TEMPLATE_DIR / style).glob("*.svg"))
+
+
+def generate(style: str, flavors: Iterable[str] = FLAVORS, out_root: Path = AURORAE_DIR) -> list:
+    """Render every template of a style for all flavors, one pass per template."""
+    flavors = list(flavors)
+    colors = {flavor: flavor_colors(flavor) for flavor in flavors}
+    written = []
+    for template in templates(style):
+        paths = {flavor: out_root / theme_dir_for(flavor, style).name / template.name for flavor in flavors}
+        for path in paths.values():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        outputs = {flavor: path.open("wb") for flavor, path in paths.items()}
+        try:
+            with template.open("rb") as source:
+                recolor_stream(source, outputs, colors)
+        finally:
+            for out in outputs.values():
+                out.close()
+        written += paths.values()
+    return written
+
+
+def check(style: str, flavors: Iterable[str] = FLAVORS) -> list:
+    """List the checked-in SVGs that differ from their template rendering."""
+    flavors = list(flavors)
+    colors = {flavor: flavor_colors(flavor) for flavor in flavors}
+    stale = []
+    for template in templates(style):
+        outputs = {flavor: io.BytesIO() for flavor in flavors}
+        with template.open("rb") as source:
+            recolor_stream(source, outputs, colors)
+        for flavor, out in outputs.items():
+            path = theme_dir_for(flavor, style) / template.name
+            if not path.exists() or path.read_bytes() != out.getvalue():
+                stale.append(path)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Aurorae SVGs from the style templates.")
+    parser.add_argument("-o", "--output", type=Path, default=AURORAE_DIR,
+                        help="Output directory (default: the checked-in Aurorae themes)")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append", help="Style (default: all)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report checked-in SVGs that are out of date")
+    args = parser.parse_args()
+
+    flavors = args.flavour or FLAVORS
+    if args.check:
+        stale = [path for style in args.style or STYLES for path in check(style, flavors)]
+        for path in stale:
+            print(f"✗ out of date: {path}")
+        return 1 if stale else 0
+
+    written = [path for style in args.style or STYLES for path in generate(style, flavors, args.output)]
+    print(f"Wrote {len(written)} SVGs to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Offscreen batch renderer for theme previews.
+Draws the preview window (CustomTitleBar with its TitleBarButtons) inside the
+real Aurorae decoration.svg frame for every flavor x style x accent, using the
+Qt `offscreen` platform so no display server is needed. Renders are spread
+over a process pool and written as compressed PNGs.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from mies.palette import ACCENTS
+from mies.palette_index import open_index
+from mies.paths import FLAVORS, REPO_ROOT, STYLES
+from mies.preview import PYQT6, QApplication, QColor, QPainter, QPoint, Qt, QWidget, ThemeWindow
+from mies.theme import theme_dir_for
+
+if PYQT6:
+    from PyQt6.QtCore import QRectF
+    from PyQt6.QtGui import QImage, QRegion
+    from PyQt6.QtSvg import QSvgRenderer
+else:
+    from PyQt5.QtCore import QRectF
+    from PyQt5.QtGui import QImage, QRegion
+    from PyQt5.QtSvg import QSvgRenderer
+
+PREVIEW_DIR = REPO_ROOT / "dist" / "previews"
+WINDOW_SIZE = (650, 500)
+
+_app = None
+_window = None
+
+
+def draw_frame(painter: QPainter, renderer: QSvgRenderer, rect: QRectF):
+    """Draw the nine decoration-* elements of an Aurorae decoration around rect."""
+    top_left = renderer.boundsOnElement("decoration-topleft")
+    bottom_right = renderer.boundsOnElement("decoration-bottomright")
+    xs = (rect.left(), rect.left() + top_left.width(), rect.right() - bottom_right.width(), rect.right())
+    ys = (rect.top(), rect.top() + top_left.height(), rect.bottom() - bottom_right.height(), rect.bottom())
+
+    rows = (("topleft", "top", "topright"), ("left", "center", "right"),
+            ("bottomleft", "bottom", "bottomright"))
+    for row, parts in enumerate(rows):
+        for col, part in enumerate(parts):
+            target = QRectF(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row])
+            renderer.render(painter, f"decoration-{part}", target)
+
+
+def _window_for(flavor: str, style: str) -> ThemeWindow:
+    global _app, _window
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv[:1])
+    if _window is None:
+        _window = ThemeWindow(preload=False)
+        _window.resize(*WINDOW_SIZE)
+        _window.show()
+    _window.combo_flavor.setCurrentText(flavor)
+    _window.combo_style.setCurrentText(style)
+    _app.processEvents()
+    return _window
+
+
+def render_preview(flavor: str, style: str, accent: str) -> QImage:
+    """Render one preview image."""
+    window = _window_for(flavor, style)
+    cfg = window.theme.config
+    width = window.width() + cfg.padding_left + cfg.padding_right
+    height = window.height() + cfg.padding_top + cfg.padding_bottom
+
+    fmt = QImage.Format.Format_ARGB32_Premultiplied if PYQT6 else QImage.Format_ARGB32_Premultiplied
+    image = QImage(width, height, fmt)
+    image.fill(Qt.GlobalColor.transparent if PYQT6 else Qt.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing if PYQT6 else QPainter.Antialiasing)
+    draw_frame(painter, QSvgRenderer(str(theme_dir_for(flavor, style) / "decoration.svg")),
+               QRectF(0, 0, width, height))
+
+    flags = QWidget.RenderFlag.DrawChildren if PYQT6 else QWidget.DrawChildren
+    window.render(painter, QPoint(cfg.padding_left, cfg.padding_top), QRegion(), flags)
+
+    # The accent is the color scheme's DecorationFocus color
+    painter.setPen(QColor(open_index().hex(flavor, accent.lower())))
+    painter.setBrush(Qt.BrushStyle.NoBrush if PYQT6 else Qt.NoBrush)
+    painter.drawRoundedRect(QRectF(cfg.padding_left + 5.5, cfg.padding_top + 5.5,
+                                   window.width() - 11, window.height() - 11), 12, 12)
+    painter.end()
+    return image
+
+
+def preview_path(out_dir: Path, flavor: str, style: str, accent: str) -> Path:
+    return out_dir / style / f"Catppuccin-{flavor}-{accent}.png"
+
+
+def render_job(flavor: str, style: str, accent: str, out_dir: Path) -> Path:
+    path = preview_path(out_dir, flavor, style, accent)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # zlib's default level; the strongest one is 3x slower for 2% smaller files
+    if not render_preview(flavor, style, accent).save(str(path), "PNG"):
+        raise OSError(f"Could not write {path}")
+    return path
+
+
+def render_all(out_dir: Path, flavors: Iterable[str] = FLAVORS, styles: Iterable[str] = STYLES,
+               accents: Iterable[str] = ACCENTS, workers: int = None) -> list:
+    """Render every combination across a process pool."""
+    jobs = [(f, s, a) for f in flavors for s in styles for a in accents]
+    # Qt must not be initialized in a forked child of a process that loaded it
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        futures = [pool.submit(render_job, *job, out_dir) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render preview PNGs for every theme offscreen.")
+    parser.add_argument("-o", "--output", type=Path, default=PREVIEW_DIR, help="Output directory")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append", help="Style (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append", help="Accent (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    written = render_all(args.output, args.flavour or FLAVORS, args.style or STYLES,
+                         args.accent or ACCENTS, args.jobs)
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(written)} previews in {elapsed:.2f}s -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Pre-scaled splash screen assets.
+Splash.qml shows the logo at Kirigami.Units.gridUnit * 8 (144 px with the
+default 18 px grid unit), but the shipped logos are 1544 px PNGs that are
+decoded and scaled down at every login. The logo is pre-scaled once per
+common device pixel ratio and every PNG (logos and splash previews) is
+recompressed losslessly. The widths that are shipped are written into
+Splash.qml, which picks the smallest logo covering its on-screen size.
+
+Assets are stored content-addressed in a cache directory shared by all builds,
+so the matrix of LookAndFeel packages scales each logo only once, and widths
+that come out identical are only shipped once. Scaling needs PyQt, which is
+only imported when a logo is actually scaled, so builds whose assets are
+cached never load it; without PyQt only the full-size logo is recompressed.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterable
+
+from mies.paths import FLAVORS, RESOURCES_DIR
+
+SPLASH_DIR = RESOURCES_DIR / "splash-screen" / "contents" / "splash"
+SPLASH_PREVIEW_DIR = RESOURCES_DIR / "splash-previews"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "catppuccin-mies" / "splash"
+
+LOGO_SIZE = 144  # logical px: Kirigami.Units.gridUnit (18) * 8, as in Splash.qml
+SCALES = (1, 1.25, 1.5, 2, 2.5, 3)
+WIDTHS_TOKEN = "/*REPLACE--LOGO-WIDTHS*/"
+
+# Bump when the scaling or compression changes, to invalidate cached assets
+ASSET_VERSION = b"1"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Chunks that affect how the image looks; text, time, EXIF, pHYs and bKGD are dropped
+KEEP_CHUNKS = {b"IHDR", b"PLTE", b"tRNS", b"gAMA", b"cHRM", b"sRGB", b"iCCP", b"sBIT", b"IEND"}
+
+
+def logo_source(flavor: str) -> Path:
+    return SPLASH_DIR / "images" / ("Latte_Logo.png" if flavor == "Latte" else "Logo.png")
+
+
+def preview_source(flavor: str) -> Path:
+    return SPLASH_PREVIEW_DIR / f"{flavor}.png"
+
+
+def _chunks(data: bytes):
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG file")
+    i = len(PNG_SIGNATURE)
+    while i < len(data):
+        length, kind = struct.unpack(">I4s", data[i:i + 8])
+        yield kind, data[i + 8:i + 8 + length]
+        i += 12 + length
+
+
+def _chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+
+def recompress_png(data: bytes) -> bytes:
+    """The same pixels with maximum zlib compression and no metadata chunks.
+    The original is returned if it is already smaller."""
+    head, idat, tail = [], bytearray(), []
+    for kind, body in _chunks(data):
+        if kind == b"IDAT":
+            idat += body
+        elif kind in KEEP_CHUNKS:
+            (tail if idat else head).append(_chunk(kind, body))
+
+    raw = zlib.decompress(bytes(idat))
+    candidates = []
+    for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        candidates.append(compressor.compress(raw) + compressor.flush())
+    best = min(candidates, key=len)
+
+    result = PNG_SIGNATURE + b"".join(head) + _chunk(b"IDAT", best) + b"".join(tail)
+    return result if len(result) < len(data) else data
+
+
+def has_qt() -> bool:
+    return any(importlib.util.find_spec(name) for name in ("PyQt6", "PyQt5"))
+
+
+def scale_png(data: bytes, width: int) -> bytes:
+    """A PNG scaled down to the given width (area-averaged), as PNG."""
+    try:
+        from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+        from PyQt6.QtGui import QImage
+        pyqt6 = True
+    except ImportError:
+        from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, Qt
+        from PyQt5.QtGui import QImage
+        pyqt6 = False
+    image = QImage.fromData(data)
+    if pyqt6:
+        scaled = image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+        mode = QIODevice.OpenModeFlag.WriteOnly
+    else:
+        scaled = image.scaledToWidth(width, Qt.SmoothTransformation)
+        mode = QIODevice.WriteOnly
+    array = QByteArray()
+    buffer = QBuffer(array)
+    buffer.open(mode)
+    scaled.save(buffer, "PNG")
+    return bytes(array)
+
+
+def logo_widths(source_width: int) -> list:
+    """Target widths below the source width; larger screens use the full-size logo."""
+    widths = sorted({round(LOGO_SIZE * scale) for scale in SCALES})
+    return [width for width in widths if width < source_width]
+
+
+def _png_width(data: bytes) -> int:
+    return struct.unpack(">I", data[16:20])[0]
+
+
+def _key(source: bytes, width: int) -> str:
+    return hashlib.sha256(ASSET_VERSION + b"\0" + str(width).encode() + b"\0" + source).hexdigest()
+
+
+def make_asset(source: Path, width: int = 0) -> bytes:
+    """A PNG recompressed, after scaling it to width unless that is 0."""
+    data = source.read_bytes()
+    return recompress_png(scale_png(data, width) if width else data)
+
+
+def cached_asset(source: Path, width: int = 0, cache: Path = CACHE_DIR) -> Path:
+    """Path of a cached asset, made (and written atomically) if it is missing."""
+    path = cache / f"{_key(source.read_bytes(), width)}.png"
+    if not path.exists():
+        cache.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(make_asset(source, width))
+        os.replace(tmp, path)
+    return path
+
+
+def _widths(source: Path) -> list:
+    """Logo widths to make, 0 being the recompressed full-size logo."""
+    if not has_qt():
+        return [0]
+    with source.open("rb") as f:
+        return [0] + logo_widths(_png_width(f.read(24)))
+
+
+def logo_assets(flavor: str, cache: Path = CACHE_DIR) -> dict:
+    """Cached logo files by width, 0 being the full-size logo.
+    Widths whose output is identical to a smaller one are left out."""
+    source = logo_source(flavor)
+    assets = {}
+    seen = set()
+    for width in _widths(source):
+        path = cached_asset(source, width, cache)
+        digest = hashlib.sha256(path.read_bytes()).digest()
+        if width == 0 or digest not in seen:
+            seen.add(digest)
+            assets[width] = path
+    return assets
+
+
+def preview_asset(flavor: str, cache: Path = CACHE_DIR) -> Path:
+    return cached_asset(preview_source(flavor), 0, cache)
+
+
+def prepare(flavors: Iterable[str] = FLAVORS, cache: Path = CACHE_DIR, workers: int = None) -> float:
+    """Fill the cache for the given flavors across a process pool.
+    Returns the elapsed time in seconds."""
+    start = time.perf_counter()
+    flavors = list(flavors)
+    logos = sorted({logo_source(flavor) for flavor in flavors})  # flavors sharing a logo share its assets
+    jobs = [(logo, width) for logo in logos for width in _widths(logo)]
+    jobs += [(preview_source(flavor), 0) for flavor in flavors]
+    # Qt must not be initialized in a forked child of a process that loaded it
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        for future in [pool.submit(cached_asset, source, width, cache) for source, width in jobs]:
+            future.result()
+    return time.perf_counter() - start
+
+
+def install_splash(flavor: str, images: Path, previews: Path, qml: str, cache: Path = CACHE_DIR) -> str:
+    """Copy the logos and preview of a flavor and return Splash.qml with their widths."""
+    assets = logo_assets(flavor, cache)
+    shutil.copyfile(assets.pop(0), images / "Logo.png")
+    for width, path in assets.items():
+        shutil.copyfile(path, images / f"Logo-{width}.png")
+    shutil.copyfile(preview_asset(flavor, cache), previews / "splash.png")
+    return qml.replace(WIDTHS_TOKEN, ", ".join(str(width) for width in sorted(assets)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-scale and recompress the splash screen images.")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--cache", type=Path, default=CACHE_DIR, help=f"Asset cache (default: {CACHE_DIR})")
+    args = parser.parse_args()
+
+    if not has_qt():
+        print("Warning: PyQt is not installed; logos are only recompressed, not pre-scaled.")
+    flavors = args.flavour or FLAVORS
+    elapsed = prepare(flavors, args.cache, args.jobs)
+    for flavor in flavors:
+        logo = logo_source(flavor)
+        assets = logo_assets(flavor, args.cache)
+        sizes = ", ".join(f"{width}: {path.stat().st_size}" for width, path in sorted(assets.items()) if width)
+        print(f"  {flavor:10} {logo.name} {logo.stat().st_size} -> {assets[0].stat().st_size} bytes"
+              f"{'; ' + sizes if sizes else ''}")
+        preview = preview_source(flavor)
+        print(f"  {'':10} {preview.name} {preview.stat().st_size} -> "
+              f"{preview_asset(flavor, args.cache).stat().st_size} bytes")
+    print(f"Prepared in {elapsed:.2f}s -> {args.cache}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,572 @@
+"""
+Optimizer for the Aurorae decoration.svg files.
+The decorations are Inkscape exports that KWin parses and rasterizes for every
+decorated window and on every resize. optimize() keeps what renders and what
+Aurorae looks up and drops the rest: editor-only elements and attributes
+(sodipodi, inkscape, rdf/cc/dc metadata), unreferenced ids and defs, style
+properties that restate the inherited or initial value, and duplicate
+gradients. Group transforms are pushed down and folded into the coordinates
+of plain rects and paths. The decoration-*, mask-*, shadow-* and hint-* ids
+and the ColorScheme style block are always kept.
+
+The build runs every decoration through optimize(); `python3 -m mies.svgopt`
+reports the bytes saved and the QSvgRenderer parse and raster times before and
+after for all themes, and checks that every element renders in the same place.
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from mies.paths import FLAVORS, STYLES
+from mies.theme import theme_dir_for
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+EDITOR_NS = ("http://www.inkscape.org/namespaces/inkscape",
+             "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+             "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+             "http://creativecommons.org/ns#",
+             "http://purl.org/dc/elements/1.1/")
+
+SVG = f"{{{SVG_NS}}}"
+HREF = f"{{{XLINK_NS}}}href"
+
+# Ids Aurorae (Plasma::FrameSvg) looks up, plus the Plasma color scheme style block
+KEEP_ID_RE = re.compile(r'^(decoration|mask|shadow|hint-|current-color-scheme)')
+
+URL_RE = re.compile(r'url\(\s*#([^)\s]+)\s*\)')
+NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+PATH_TOKEN_RE = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+
+TEXT_TAGS = {SVG + "text", SVG + "tspan", SVG + "textPath", SVG + "flowRoot"}
+GRADIENT_TAGS = {SVG + "linearGradient", SVG + "radialGradient"}
+
+# Properties that only affect text, or elements these files do not contain
+UNUSED_PROPERTIES = re.compile(r'^(font|text-|line-height|letter-spacing|word-spacing|writing-mode|direction'
+                               r'|dominant-baseline|baseline-shift|white-space|inline-size|shape-'
+                               r'|solid-|-inkscape)')
+# Initial values of inherited properties; restating the inherited value is dropped
+INHERITED = {"fill-opacity": "1", "stroke-opacity": "1", "fill-rule": "nonzero", "clip-rule": "nonzero",
+             "visibility": "visible", "stroke": "none", "stroke-width": "1", "stroke-linecap": "butt",
+             "stroke-linejoin": "miter", "stroke-miterlimit": "4", "stroke-dasharray": "none",
+             "stroke-dashoffset": "0", "paint-order": "normal", "color-interpolation": "sRGB",
+             "color-interpolation-filters": "linearRGB", "color-rendering": "auto",
+             "shape-rendering": "auto", "image-rendering": "auto"}
+# Initial values of properties that are not inherited
+NOT_INHERITED = {"opacity": "1", "stop-opacity": "1", "mix-blend-mode": "normal", "isolation": "auto",
+                 "display": "inline", "overflow": "visible", "enable-background": "accumulate",
+                 "vector-effect": "none"}
+STROKE_GEOMETRY = ("stroke-width", "stroke-linecap", "stroke-linejoin", "stroke-miterlimit",
+                   "stroke-dasharray", "stroke-dashoffset")
+PAINT_ATTRS = ("fill", "stroke", "clip-path", "mask", "filter")
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+
+def _num(value: float) -> str:
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def _same(a: str, b: str) -> bool:
+    try:
+        return float(a) == float(b)
+    except ValueError:
+        return a.strip().lower() == b.strip().lower()
+
+
+# Transforms are (a, b, c, d, e, f) as in matrix(a b c d e f)
+
+def multiply(m: tuple, n: tuple) -> tuple:
+    """The transform applying n first, then m."""
+    a, b, c, d, e, f = m
+    p, q, r, s, t, u = n
+    return (a * p + c * q, b * p + d * q, a * r + c * s, b * r + d * s, a * t + c * u + e, b * t + d * u + f)
+
+
+def parse_transform(text: str) -> tuple:
+    result = IDENTITY
+    for kind, args in TRANSFORM_RE.findall(text or ""):
+        v = [float(x) for x in NUMBER_RE.findall(args)]
+        if kind == "matrix":
+            m = tuple(v)
+        elif kind == "translate":
+            m = (1, 0, 0, 1, v[0], v[1] if len(v) > 1 else 0)
+        elif kind == "scale":
+            m = (v[0], 0, 0, v[1] if len(v) > 1 else v[0], 0, 0)
+        elif kind == "rotate":
+            cos, sin = math.cos(math.radians(v[0])), math.sin(math.radians(v[0]))
+            cos, sin = round(cos, 12), round(sin, 12)
+            m = (cos, sin, -sin, cos, 0, 0)
+            if len(v) == 3:
+                m = multiply(multiply((1, 0, 0, 1, v[1], v[2]), m), (1, 0, 0, 1, -v[1], -v[2]))
+        elif kind == "skewX":
+            m = (1, 0, math.tan(math.radians(v[0])), 1, 0, 0)
+        else:
+            m = (1, math.tan(math.radians(v[0])), 0, 1, 0, 0)
+        result = multiply(result, m)
+    return result
+
+
+def format_transform(m: tuple) -> str:
+    a, b, c, d, e, f = m
+    if (a, b, c, d) == (1, 0, 0, 1):
+        return "" if (e, f) == (0, 0) else f"translate({_num(e)},{_num(f)})"
+    # Matrices can scale by 20x or more, so they need more digits than coordinates
+    return "matrix(" + ",".join(f"{x:.9g}" for x in m) + ")"
+
+
+def _round(m: tuple) -> tuple:
+    return tuple(round(x, 9) + 0.0 for x in m)
+
+
+def parse_style(text: str) -> dict:
+    style = {}
+    for declaration in (text or "").split(";"):
+        name, sep, value = declaration.partition(":")
+        if sep and name.strip():
+            style[name.strip()] = value.strip()
+    return style
+
+
+def format_style(style: dict) -> str:
+    return ";".join(f"{name}:{value}" for name, value in style.items())
+
+
+# Path data
+
+def _path_commands(d: str) -> list:
+    """[(command, [numbers])] with implicit repeats split into their own commands."""
+    arity = {"m": 2, "l": 2, "h": 1, "v": 1, "c": 6, "s": 4, "q": 4, "t": 2, "a": 7, "z": 0}
+    commands = []
+    command, numbers = None, []
+    for token in PATH_TOKEN_RE.findall(d) + ["Z"]:
+        if token.isalpha():
+            if command is not None:
+                commands.append((command, numbers))
+            command, numbers = token, []
+        else:
+            numbers.append(float(token))
+    commands.append((command, numbers))
+
+    split = []
+    for command, numbers in commands[:-1]:
+        n = arity[command.lower()]
+        if n == 0:
+            split.append((command, []))
+            continue
+        for i in range(0, len(numbers), n):
+            # Pairs after a moveto are implicit linetos of the same case
+            repeat = command if i == 0 or command.lower() != "m" else ("L" if command == "M" else "l")
+            split.append((repeat, numbers[i:i + n]))
+    return split
+
+
+def transform_path(d: str, m: tuple) -> str:
+    """Path data with a transform applied; arcs are only moved, never scaled or rotated."""
+    a, b, c, dd, e, f = m
+    has_arcs = any(ch in "Aa" for ch in d)
+    if has_arcs and (a, b, c, dd) != (1, 0, 0, 1):
+        raise ValueError("Arcs can only be translated")
+
+    def point(x, y, relative):
+        if relative:
+            return a * x + c * y, b * x + dd * y
+        return a * x + c * y + e, b * x + dd * y + f
+
+    out = []
+    first = True
+    x = y = 0.0  # current point in the source, for H/V
+    start = (0.0, 0.0)
+    for command, v in _path_commands(d):
+        relative = command.islower() and not (first and command == "m")
+        kind = command.lower()
+        first = False
+        if kind == "z":
+            out.append(command)
+            x, y = start
+            continue
+        if kind in "hv":
+            # H/V stay horizontal/vertical only without rotation; write them as lines
+            if kind == "h":
+                dx, dy = (v[0], 0.0) if relative else (v[0] - x, 0.0)
+            else:
+                dx, dy = (0.0, v[0]) if relative else (0.0, v[0] - y)
+            x, y = x + dx, y + dy
+            if relative:
+                px, py = point(dx, dy, True)
+                out.append("l" + " ".join(_num(n) for n in (px, py)))
+            else:
+                px, py = point(x, y, False)
+                out.append("L" + " ".join(_num(n) for n in (px, py)))
+            continue
+        if kind == "a":
+            values = v[:5] + list(point(v[5], v[6], relative))
+            new_x, new_y = (x + v[5], y + v[6]) if relative else (v[5], v[6])
+        else:
+            values = []
+            for i in range(0, len(v), 2):
+                values += point(v[i], v[i + 1], relative)
+            new_x, new_y = (x + v[-2], y + v[-1]) if relative else (v[-2], v[-1])
+        x, y = new_x, new_y
+        if kind == "m":
+            start = (x, y)
+        out.append(("M" if command == "m" and not relative else command) + " ".join(_num(n) for n in values))
+    return "".join(out)
+
+
+# Tree passes
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _namespace(name: str) -> str:
+    return name[1:].partition("}")[0] if name.startswith("{") else ""
+
+
+def strip_editor_data(root: ET.Element):
+    """Remove sodipodi/inkscape/rdf/cc/dc elements and attributes and <metadata>."""
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if _namespace(child.tag) in EDITOR_NS or child.tag == SVG + "metadata":
+                parent.remove(child)
+    for element in root.iter():
+        for name in [name for name in element.attrib if _namespace(name) in EDITOR_NS]:
+            del element.attrib[name]
+
+
+def _references(root: ET.Element) -> set:
+    found = set()
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            found.update(URL_RE.findall(value))
+            if name in (HREF, "href") and value.startswith("#"):
+                found.add(value[1:])
+    return found
+
+
+def merge_duplicate_defs(root: ET.Element):
+    """Point every reference to the first of several identical gradients."""
+    renames = {}
+    seen = {}
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if child.tag not in GRADIENT_TAGS or "id" not in child.attrib:
+                continue
+            clone = ET.Element(child.tag, dict(sorted((k, v) for k, v in child.attrib.items() if k != "id")))
+            clone.extend(child)
+            key = ET.tostring(clone)
+            if key in seen:
+                renames[child.get("id")] = seen[key]
+                parent.remove(child)
+            else:
+                seen[key] = child.get("id")
+    if not renames:
+        return
+
+    def rename(match):
+        return f"url(#{renames.get(match.group(1), match.group(1))})"
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            if name in (HREF, "href") and value[1:] in renames:
+                element.set(name, "#" + renames[value[1:]])
+            elif "url(" in value:
+                element.set(name, URL_RE.sub(rename, value))
+
+
+def prune_ids(root: ET.Element):
+    """Drop unreferenced defs and the ids nothing refers to."""
+    while True:
+        referenced = _references(root)
+        removed = False
+        for defs in root.iter(SVG + "defs"):
+            for child in list(defs):
+                if child.get("id") not in referenced and not KEEP_ID_RE.match(child.get("id", "")):
+                    defs.remove(child)
+                    removed = True
+        if not removed:
+            break
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if child.tag == SVG + "defs" and len(child) == 0:
+                parent.remove(child)
+            elif child.tag == SVG + "style" and not (child.text or "").strip():
+                parent.remove(child)
+    for element in root.iter():
+        ident = element.get("id")
+        if ident is not None and ident not in referenced and not KEEP_ID_RE.match(ident):
+            del element.attrib["id"]
+
+
+def clean_styles(element: ET.Element, inherited: dict, has_text: bool):
+    """Drop style properties that have no effect, recursively."""
+    style = parse_style(element.get("style"))
+    for name in list(style):
+        value = style[name]
+        if not has_text and UNUSED_PROPERTIES.match(name):
+            del style[name]
+        elif name in NOT_INHERITED and _same(value, NOT_INHERITED[name]):
+            del style[name]
+        elif name in INHERITED and _same(value, inherited.get(name, INHERITED[name])):
+            del style[name]
+
+    effective = dict(inherited)
+    for name in INHERITED:
+        if name in style:
+            effective[name] = style[name]
+        elif name in element.attrib:
+            effective[name] = element.get(name)
+    # Without a stroke, nothing below this element uses the stroke geometry
+    if len(element) == 0 and _same(effective.get("stroke", "none"), "none"):
+        for name in STROKE_GEOMETRY:
+            style.pop(name, None)
+
+    if style:
+        element.set("style", format_style(style))
+    elif "style" in element.attrib:
+        del element.attrib["style"]
+    for child in element:
+        clean_styles(child, effective, has_text)
+
+
+def _paints_with_url(element: ET.Element, inherited_url: bool) -> bool:
+    style = parse_style(element.get("style"))
+    values = [style.get(name, element.get(name, "")) for name in PAINT_ATTRS]
+    return inherited_url or any("url(" in value for value in values)
+
+
+def _rigid(m: tuple) -> bool:
+    """Whether a transform keeps lengths, so stroke widths survive folding it."""
+    a, b, c, d = m[:4]
+    return (math.isclose(a * a + b * b, 1) and math.isclose(c * c + d * d, 1)
+            and math.isclose(a * c + b * d, 0, abs_tol=1e-9))
+
+
+def _fold_rect(rect: ET.Element, m: tuple, stroked: bool) -> bool:
+    a, b, c, d, e, f = m
+    if stroked and not _rigid(m):
+        return False
+    if b == 0 and c == 0:
+        sx, sy, swap = a, d, False
+    elif a == 0 and d == 0:
+        sx, sy, swap = b, c, True
+    else:
+        return False
+    try:
+        x, y = float(rect.get("x", 0)), float(rect.get("y", 0))
+        w, h = float(rect.get("width")), float(rect.get("height"))
+        rx = rect.get("rx", rect.get("ry"))
+        ry = rect.get("ry", rect.get("rx"))
+    except (TypeError, ValueError):
+        return False
+
+    if swap:
+        # (x, y) -> (c * y + e, b * x + f)
+        xs = sorted((sy * y + e, sy * (y + h) + e))
+        ys = sorted((sx * x + f, sx * (x + w) + f))
+        new_rx, new_ry = (ry, rx)
+        scale_rx, scale_ry = abs(sy), abs(sx)
+    else:
+        xs = sorted((sx * x + e, sx * (x + w) + e))
+        ys = sorted((sy * y + f, sy * (y + h) + f))
+        new_rx, new_ry = (rx, ry)
+        scale_rx, scale_ry = abs(sx), abs(sy)
+
+    rect.set("x", _num(xs[0]))
+    rect.set("y", _num(ys[0]))
+    rect.set("width", _num(xs[1] - xs[0]))
+    rect.set("height", _num(ys[1] - ys[0]))
+    if new_rx is not None:
+        rect.set("rx", _num(float(new_rx) * scale_rx))
+        rect.set("ry", _num(float(new_ry) * scale_ry))
+    return True
+
+
+def _fold_path(path: ET.Element, m: tuple, stroked: bool) -> bool:
+    if stroked and not _rigid(m) or "d" not in path.attrib:
+        return False
+    try:
+        path.set("d", transform_path(path.get("d"), m))
+    except (ValueError, IndexError, KeyError):
+        return False
+    return True
+
+
+def collapse_transforms(element: ET.Element, m: tuple = IDENTITY, url: bool = False, stroked: bool = False):
+    """Push group transforms down and fold them into rect and path coordinates."""
+    m = _round(multiply(m, parse_transform(element.get("transform"))))
+    url = _paints_with_url(element, url)
+    style = parse_style(element.get("style"))
+    stroke = style.get("stroke", element.get("stroke"))
+    if stroke is not None:
+        stroked = not _same(stroke, "none")
+    element.attrib.pop("transform", None)
+
+    local = _local(element.tag)
+    clipped = any(name in element.attrib or name in style for name in ("clip-path", "mask", "filter"))
+    if local == "g" and not clipped:
+        for child in element:
+            collapse_transforms(child, m, url, stroked)
+        return
+
+    folded = m == IDENTITY
+    if not folded and not url:
+        if local == "rect":
+            folded = _fold_rect(element, m, stroked)
+        elif local == "path":
+            folded = _fold_path(element, m, stroked)
+    if not folded:
+        element.set("transform", format_transform(m))
+    for child in element:
+        if _local(child.tag) != "defs":
+            collapse_transforms(child, IDENTITY, url, stroked)
+
+
+def strip_whitespace(root: ET.Element):
+    for element in root.iter():
+        if element.tag == SVG + "style":
+            continue
+        if element.text and not element.text.strip():
+            element.text = None
+        if element.tail and not element.tail.strip():
+            element.tail = None
+
+
+def optimize(data: bytes) -> bytes:
+    """An optimized copy of an SVG document."""
+    root = ET.fromstring(data)
+    has_text = any(element.tag in TEXT_TAGS for element in root.iter())
+
+    strip_editor_data(root)
+    if not has_text:
+        root.attrib.pop(f"{{{XML_NS}}}space", None)
+    prune_ids(root)  # first, so that unused stop ids do not keep gradients apart
+    merge_duplicate_defs(root)
+    prune_ids(root)
+    clean_styles(root, {}, has_text)
+    for child in root:
+        if _local(child.tag) not in ("defs", "style"):
+            collapse_transforms(child)
+    strip_whitespace(root)
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True) + b"\n"
+
+
+def optimize_file(source: Path, dest: Path):
+    dest.write_bytes(optimize(source.read_bytes()))
+
+
+# Report
+
+def _qt():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from mies import render
+    if render.PYQT6:
+        from PyQt6.QtCore import QByteArray
+    else:
+        from PyQt5.QtCore import QByteArray
+    return render, QByteArray
+
+
+def _time(fn, repeats: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def _element_ids(data: bytes) -> list:
+    """The kept ids of elements that render (not gradients or the style block)."""
+    root = ET.fromstring(data)
+    skipped = {id(element) for defs in root.iter(SVG + "defs") for element in defs.iter()}
+    return [element.get("id") for element in root.iter()
+            if KEEP_ID_RE.match(element.get("id", "")) and id(element) not in skipped
+            and element.tag not in GRADIENT_TAGS and element.tag != SVG + "style"]
+
+
+def measure(data: bytes, repeats: int) -> dict:
+    """QSvgRenderer parse time, and raster time of the frame at the preview size."""
+    render, QByteArray = _qt()
+    fmt = render.QImage.Format.Format_ARGB32_Premultiplied if render.PYQT6 else render.QImage.Format_ARGB32_Premultiplied
+    image = render.QImage(*render.WINDOW_SIZE, fmt)
+    renderer = render.QSvgRenderer(QByteArray(data))
+    rect = render.QRectF(0, 0, *render.WINDOW_SIZE)
+
+    def raster():
+        image.fill(0)
+        painter = render.QPainter(image)
+        render.draw_frame(painter, renderer, rect)
+        painter.end()
+
+    return {"parse": _time(lambda: render.QSvgRenderer(QByteArray(data)), repeats),
+            "raster": _time(raster, repeats)}
+
+
+def compare_geometry(before: bytes, after: bytes) -> list:
+    """Ids whose rendered bounds moved by more than a hundredth of a pixel."""
+    render, QByteArray = _qt()
+    old, new = render.QSvgRenderer(QByteArray(before)), render.QSvgRenderer(QByteArray(after))
+    moved = []
+    for ident in _element_ids(before):
+        a = old.transformForElement(ident).mapRect(old.boundsOnElement(ident))
+        b = new.transformForElement(ident).mapRect(new.boundsOnElement(ident))
+        if not new.elementExists(ident) or any(abs(p - q) > 0.01 for p, q in zip(a.getRect(), b.getRect())):
+            moved.append(ident)
+    return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize the Aurorae decoration.svg files and report the gain.")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append", help="Style (default: all)")
+    parser.add_argument("-r", "--repeats", type=int, default=3, help="Timing repeats")
+    parser.add_argument("-o", "--output", type=Path, help="Also write the optimized files below this directory")
+    parser.add_argument("--no-qt", action="store_true", help="Only report sizes")
+    args = parser.parse_args()
+
+    try:
+        _qt() if not args.no_qt else None
+        timed = not args.no_qt
+    except ImportError:
+        print("Warning: PyQt is not installed; only reporting sizes.")
+        timed = False
+
+    failed = 0
+    total_before = total_after = 0
+    for style in args.style or STYLES:
+        for flavor in args.flavour or FLAVORS:
+            source = theme_dir_for(flavor, style) / "decoration.svg"
+            before = source.read_bytes()
+            after = optimize(before)
+            total_before += len(before)
+            total_after += len(after)
+            line = (f"  {source.parent.name:28} {len(before):7} -> {len(after):6} bytes "
+                    f"({(1 - len(after) / len(before)) * 100:.0f}% smaller)")
+            if timed:
+                old, new = measure(before, args.repeats), measure(after, args.repeats)
+                moved = compare_geometry(before, after)
+                failed += bool(moved)
+                line += (f"  parse {old['parse'] * 1000:.2f} -> {new['parse'] * 1000:.2f} ms"
+                         f"  raster {old['raster'] * 1000:.2f} -> {new['raster'] * 1000:.2f} ms"
+                         f"  {'✗ moved: ' + ', '.join(moved) if moved else '✓'}")
+            print(line)
+            if args.output:
+                dest = args.output / source.parent.name / source.name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_bytes(after)
+    print(f"Total {total_before} -> {total_after} bytes, saved {total_before - total_after}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Compiled templates of the LookAndFeel and splash screen metadata.
+`defaults`, `metadata.desktop` and `metadata.json` are compiled once into a
+segment list (see palette.CompiledTemplate). Compiling rejects unknown
+`--placeholder` spellings and rendering rejects unbound ones, so a typo fails
+the build instead of ending up in an installed theme. The whole
+flavor x accent x button layout matrix is rendered from the compiled form.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+from mies.cache import cached_parse
+from mies.palette import ACCENTS, CompiledTemplate
+from mies.paths import FLAVORS, REPO_ROOT, RESOURCES_DIR, STYLES
+
+LOOKANDFEEL_DIR = RESOURCES_DIR / "LookAndFeel"
+SPLASH_SCREEN_DIR = RESOURCES_DIR / "splash-screen"
+
+# Output name -> template, for one LookAndFeel package and its splash screen
+TEMPLATES = {
+    "metadata.desktop": LOOKANDFEEL_DIR / "metadata.desktop",
+    "metadata.json": LOOKANDFEEL_DIR / "metadata.json",
+    "contents/defaults": LOOKANDFEEL_DIR / "defaults",
+    "splash/metadata.desktop": SPLASH_SCREEN_DIR / "metadata.desktop",
+    "splash/metadata.json": SPLASH_SCREEN_DIR / "metadata.json",
+}
+
+# Same values install.sh uses per flavour and window decoration style
+STORE_AURORAE_NO = {
+    ("Mocha", "Modern"): "2135229", ("Mocha", "Classic"): "2135228",
+    ("Macchiato", "Modern"): "2135227", ("Macchiato", "Classic"): "2135226",
+    ("Frappe", "Modern"): "2135225", ("Frappe", "Classic"): "2135224",
+    ("Latte", "Modern"): "2135223", ("Latte", "Classic"): "2135222",
+}
+BUTTONS_LEFT = {"Modern": "SFB", "Classic": ""}
+
+PLACEHOLDERS = ("--accentName", "--flavour", "--StoreAuroraeNo", "--aurorae", "--buttonsleft")
+# `---flavour` in the templates is a literal '-' followed by `--flavour`
+PLACEHOLDER_RE = re.compile(r'--[A-Za-z]\w*')
+
+
+def compile_metadata(content: str) -> CompiledTemplate:
+    """Compile a metadata template, rejecting unknown placeholders."""
+    unknown = set(PLACEHOLDER_RE.findall(content)) - set(PLACEHOLDERS)
+    if unknown:
+        raise ValueError(f"Unknown placeholders: {', '.join(sorted(unknown))}")
+    return CompiledTemplate(content, PLACEHOLDERS)
+
+
+def compile_template(path: Path) -> CompiledTemplate:
+    """Compiled form of a template, reused until the file changes."""
+    try:
+        template = cached_parse(path, compile_metadata)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+    if template is None:
+        raise FileNotFoundError(f"Template not found: {path}")
+    return template
+
+
+def bindings_for(flavor: str, accent: str, style: str) -> dict:
+    """Placeholder values of one LookAndFeel package, as InstallGlobalTheme sets them."""
+    return {
+        "--accentName": accent,
+        "--flavour": flavor,
+        "--StoreAuroraeNo": STORE_AURORAE_NO[(flavor, style)],
+        "--aurorae": f"__aurorae__svg__Catppuccin{flavor}-{style}",
+        "--buttonsleft": BUTTONS_LEFT[style],
+    }
+
+
+def render(path: Path, bindings: dict) -> str:
+    """Render a template, failing if any of its placeholders is unbound."""
+    template = compile_template(path)
+    missing = template.missing(bindings)
+    if missing:
+        raise ValueError(f"{path}: unbound placeholders: {', '.join(sorted(missing))}")
+    return template.render(bindings)
+
+
+def render_matrix(out_dir: Path, flavors: Iterable[str] = FLAVORS, accents: Iterable[str] = ACCENTS,
+                  styles: Iterable[str] = STYLES) -> list:
+    """Render every template for every combination. Returns (directory, seconds) per variant."""
+    timings = []
+    for style in styles:
+        for flavor in flavors:
+            for accent in accents:
+                start = time.perf_counter()
+                variant = out_dir / style / f"Catppuccin-{flavor}-{accent}"
+                bindings = bindings_for(flavor, accent, style)
+                for name, path in TEMPLATES.items():
+                    out = variant / name
+                    out.parent.mkdir(parents=True, exist_ok=True)
+                    out.write_bytes(render(path, bindings).encode("utf-8"))
+                timings.append((variant, time.perf_counter() - start))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the LookAndFeel and splash metadata templates.")
+    parser.add_argument("-o", "--output", type=Path, default=REPO_ROOT / "dist" / "templates",
+                        help="Output directory")
+    parser.add_argument("-f", "--flavour", choices=FLAVORS, action="append", help="Flavour (default: all)")
+    parser.add_argument("-a", "--accent", choices=ACCENTS, action="append", help="Accent (default: all)")
+    parser.add_argument("-s", "--style", choices=STYLES, action="append",
+                        help="Window decoration style, which sets the button layout (default: all)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print the time of every render")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        for path in TEMPLATES.values():
+            compile_template(path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    compiled = time.perf_counter() - start
+
+    timings = render_matrix(args.output, args.flavour or FLAVORS, args.accent or ACCENTS, args.style or STYLES)
+    if args.verbose:
+        for variant, seconds in timings:
+            print(f"  {seconds * 1000:6.2f} ms  {variant.relative_to(args.output)}")
+
+    total = sum(seconds for _, seconds in timings)
+    print(f"Compiled {len(TEMPLATES)} templates in {compiled * 1000:.1f} ms, rendered {len(timings)} variants "
+          f"in {total * 1000:.1f} ms ({total / len(timings) * 1e6:.0f} µs each) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
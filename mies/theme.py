@@ -0,0 +1,247 @@
+"""
+Theme model for the Aurorae decorations in this repository.
+Parses the rc config and button SVGs of a flavor/style combination without Qt,
+so themes can be validated on machines without a display server.
+"""
+
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+from mies.cache import cached_parse
+from mies.kconfig import KConfig, load_kconfig
+from mies.palette_index import open_index
+from mies.paths import AURORAE_DIR, COMMON_DIR, FLAVORS, STYLES
+from mies.trace import traced
+
+BUTTONS = ("close", "maximize", "minimize", "restore", "alldesktops", "keepabove", "keepbelow")
+
+FALLBACK_COLOR = "#888888"
+
+RECT_FILL_RE = re.compile(r'<rect[^>]*fill="(#[0-9a-fA-F]{6})"')
+STATE_GROUP_RE = re.compile(r'<g id="([\w-]+)">\s*<rect([^>]*)>')
+ATTR_RE = re.compile(r'([\w-]+)="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class ThemeConfig:
+    """Values read from an Aurorae rc file."""
+
+    button_width: int = 55
+    button_height: int = 10
+    button_spacing: int = 3
+    title_height: int = 22
+    active_text_color: str = "#cdd6f4"
+    inactive_text_color: str = "#a6adc8"
+    padding_left: int = 0
+    padding_top: int = 0
+    padding_right: int = 0
+    padding_bottom: int = 0
+    # Every [Layout] key of the rc file (Border*, ButtonMargin*, Padding*, TitleEdge*, ...)
+    layout: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({}), hash=False)
+
+
+RC_KEYS = {
+    "ButtonWidth": ("button_width", int),
+    "ButtonHeight": ("button_height", int),
+    "ButtonSpacing": ("button_spacing", int),
+    "TitleHeight": ("title_height", int),
+    "ActiveTextColor": ("active_text_color", str),
+    "InactiveTextColor": ("inactive_text_color", str),
+    "PaddingLeft": ("padding_left", int),
+    "PaddingTop": ("padding_top", int),
+    "PaddingRight": ("padding_right", int),
+    "PaddingBottom": ("padding_bottom", int),
+}
+
+
+def rc_config(config: KConfig) -> ThemeConfig:
+    """The values of a parsed rc file we care about."""
+    values = {}
+    for group in ("General", "Layout"):
+        for key, value in config.group(group).items():
+            if key in RC_KEYS:
+                name, convert = RC_KEYS[key]
+                values[name] = convert(value)
+
+    layout = {}
+    for key, value in config.group("Layout").items():
+        try:
+            layout[key] = int(value)
+        except ValueError:
+            print(f"Warning: Ignoring non-integer layout value {key}={value}")
+    return ThemeConfig(**values, layout=MappingProxyType(layout))
+
+
+def parse_rc(content: str) -> ThemeConfig:
+    """Parse the values of an rc file we care about."""
+    return rc_config(KConfig(content))
+
+
+@dataclass(frozen=True)
+class ButtonState:
+    """One <g id="...-center"> state of a button SVG."""
+
+    fill: str
+    opacity: float = 1.0
+
+
+@dataclass(frozen=True)
+class ButtonArt:
+    """Rect fills of a button SVG, in document order and per state group.
+    `digest` identifies the whole file, so any edit to the art compares unequal."""
+
+    fills: tuple
+    states: Mapping[str, ButtonState] = field(default_factory=dict)
+    digest: str = ""
+
+    @property
+    def color(self) -> str:
+        """Primary (active state) fill color."""
+        return self.fills[0] if self.fills else FALLBACK_COLOR
+
+
+def parse_button_svg(content: str) -> ButtonArt:
+    """Extract the rect fills and state groups from a button SVG."""
+    states = {}
+    for group_id, attrs in STATE_GROUP_RE.findall(content):
+        attr = dict(ATTR_RE.findall(attrs))
+        if "fill" in attr:
+            states[group_id] = ButtonState(attr["fill"], float(attr.get("fill-opacity", 1.0)))
+    digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    return ButtonArt(tuple(RECT_FILL_RE.findall(content)), MappingProxyType(states), digest)
+
+
+def palette_hex(flavor: str) -> dict:
+    """Hex colors of a flavor's palette, falling back to Mocha."""
+    index = open_index()
+    return index.flavor_hex(flavor if flavor in index.flavors else "Mocha")
+
+
+def rc_file_for(flavor: str, style: str) -> Path:
+    """Get the correct rc file path."""
+    if flavor == "Latte":
+        return COMMON_DIR / f"CatppuccinLatte-{style}rc"
+    else:
+        return COMMON_DIR / f"Catppuccin-{style}rc"
+
+
+def theme_dir_for(flavor: str, style: str) -> Path:
+    """Get the Aurorae directory of a flavor/style combination."""
+    return AURORAE_DIR / f"Catppuccin{flavor}-{style}"
+
+
+@dataclass(frozen=True)
+class Theme:
+    """Immutable, fully resolved theme configuration."""
+
+    flavor: str
+    style: str
+    theme_dir: Path
+    rc_file: Path
+    config: ThemeConfig
+    buttons: Mapping[str, ButtonArt]
+    inactive_color: str
+
+    @property
+    def button_colors(self) -> Mapping[str, str]:
+        return MappingProxyType({name: art.color for name, art in self.buttons.items()})
+
+    def get_button_color(self, button_type: str) -> str:
+        """Get the color for a specific button type."""
+        art = self.buttons.get(button_type)
+        return art.color if art else FALLBACK_COLOR
+
+    def button_file(self, button_type: str) -> Path:
+        """Get the SVG file of a button type."""
+        return self.theme_dir / f"{button_type}.svg"
+
+    def get_inactive_color(self) -> str:
+        """Get the inactive button color from SVG."""
+        return self.inactive_color
+
+    def exists(self) -> bool:
+        """Check if the theme directory exists."""
+        return self.theme_dir.exists()
+
+
+def _load_rc_config(rc_file: Path) -> ThemeConfig:
+    try:
+        config = load_kconfig(rc_file)
+        if config is None:
+            print(f"Warning: RC file not found: {rc_file}")
+            return ThemeConfig()
+        return rc_config(config)
+    except Exception as e:
+        print(f"Warning: Could not parse rc file: {e}")
+        return ThemeConfig()
+
+
+def _load_button_art(svg_path: Path) -> ButtonArt:
+    try:
+        art = cached_parse(svg_path, parse_button_svg)
+    except Exception as e:
+        print(f"Warning: Could not parse SVG {svg_path}: {e}")
+        art = None
+    return art or ButtonArt(())
+
+
+@traced()
+def load_theme(flavor: str, style: str) -> Theme:
+    """Load a theme from the repository files, reusing cached parses."""
+    theme_dir = theme_dir_for(flavor, style)
+    rc_file = rc_file_for(flavor, style)
+    buttons = {button: _load_button_art(theme_dir / f"{button}.svg") for button in BUTTONS}
+
+    # The 4th rect of close.svg is the inactive-center state
+    close_fills = buttons["close"].fills
+    if len(close_fills) >= 4:
+        inactive = close_fills[3]
+    else:
+        inactive = palette_hex(flavor)["surface0"]
+
+    return Theme(
+        flavor=flavor,
+        style=style,
+        theme_dir=theme_dir,
+        rc_file=rc_file,
+        config=_load_rc_config(rc_file),
+        buttons=MappingProxyType(buttons),
+        inactive_color=inactive,
+    )
+
+
+def theme_changes(old: Theme, new: Theme) -> set:
+    """What differs between two loads of a theme: button names, "config" and "inactive"."""
+    changes = {name for name in BUTTONS if old.buttons.get(name) != new.buttons.get(name)}
+    if old.config != new.config:
+        changes.add("config")
+    if old.inactive_color != new.inactive_color:
+        changes.add("inactive")
+    return changes
+
+
+def load_all() -> list:
+    """Load every flavor/style combination."""
+    return [load_theme(flavor, style) for flavor in FLAVORS for style in STYLES]
+
+
+def main():
+    failed = 0
+    for theme in load_all():
+        ok = theme.exists() and theme.rc_file.exists()
+        failed += not ok
+        status = "✓" if ok else "✗"
+        cfg = theme.config
+        print(f"  {status} Catppuccin{theme.flavor}-{theme.style}: "
+              f"{cfg.button_width}x{cfg.button_height}, close={theme.get_button_color('close')}, "
+              f"inactive={theme.get_inactive_color()}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
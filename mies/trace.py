@@ -0,0 +1,110 @@
+"""
+Opt-in tracing of the tools' hot paths.
+Enabled with `test-theme.py --trace` or the MIES_TRACE environment variable
+(set to the output file). Spans are recorded as Chrome trace events, which
+chrome://tracing and ui.perfetto.dev open directly, and a per-name summary
+is printed on exit. While tracing is off, span() and @traced only check a flag.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+ENV_VAR = "MIES_TRACE"
+DEFAULT_FILE = Path("mies-trace.json")
+
+_events = []
+_output = None
+_origin = time.perf_counter_ns()
+_null = nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _events.append({
+            "name": self.name,
+            "ph": "X",
+            "ts": (self.start - _origin) / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": self.args,
+        })
+
+
+def enabled() -> bool:
+    return _output is not None
+
+
+def enable(path: Path = None):
+    """Start recording; the trace is written and summarized at exit."""
+    global _output
+    if _output is None:
+        atexit.register(finish)
+    _output = Path(path) if path else DEFAULT_FILE
+
+
+def span(name: str, **args):
+    """Context manager recording one span."""
+    return _Span(name, args) if _output is not None else _null
+
+
+def traced(name: str = None):
+    """Decorator recording a span for every call."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _output is None:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summary() -> list:
+    """(name, count, total, mean, max) per span name in ms, by total time."""
+    totals = {}
+    for event in _events:
+        count, total, longest = totals.get(event["name"], (0, 0.0, 0.0))
+        totals[event["name"]] = (count + 1, total + event["dur"], max(longest, event["dur"]))
+    rows = [(name, count, total / 1000, total / count / 1000, longest / 1000)
+            for name, (count, total, longest) in totals.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def export(path: Path):
+    path.write_text(json.dumps({"traceEvents": _events, "displayTimeUnit": "ms"}))
+
+
+def finish():
+    """Write the trace file and print the summary table."""
+    if _output is None:
+        return
+    export(_output)
+    print(f"{'span':40} {'count':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}")
+    for name, count, total, mean, longest in summary():
+        print(f"{name[:40]:40} {count:7} {total:10.2f} {mean:9.3f} {longest:9.3f}")
+    print(f"Trace with {len(_events)} spans written to {_output}")
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])